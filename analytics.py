@@ -0,0 +1,178 @@
+import os
+import json
+import hashlib
+import argparse
+from functools import lru_cache
+import numpy as np
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from board import Board
+from cards import (create_chance_cards, create_community_chest_cards, MOVE_TO, MOVE_REL,
+                   NEAREST_UTILITY, NEAREST_RAILROAD, JAIL)
+from engine import BOARD_SPACES, JAIL_POSITION, GO_TO_JAIL_POSITION, MAX_DOUBLES
+
+# Bump when the chain model changes so stale cache files are ignored
+MODEL_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+JAIL_TURNS = 3
+
+# State layout: (position, doubles rolled this turn) then the jail turns remaining
+NUM_ROLL_STATES = BOARD_SPACES * MAX_DOUBLES
+NUM_STATES = NUM_ROLL_STATES + JAIL_TURNS
+
+def roll_state(position, doubles):
+    return position * MAX_DOUBLES + doubles
+
+
+def jail_state(turns_left):
+    return NUM_ROLL_STATES + JAIL_TURNS - turns_left
+
+
+def space_names(board):
+    return [space.label for space in board.spaces]
+
+
+@lru_cache(maxsize=None)
+def card_effects():
+    return [[list(card.effect) for card in deck]
+            for deck in (create_chance_cards(), create_community_chest_cards())]
+
+
+def definition_hash(board):
+    # Everything the chain depends on; any edit to the board or decks changes the key
+    definition = {
+        "model": MODEL_VERSION,
+        "properties": [(p.name, p.price, p.position) for p in board.properties],
+        "railroads": board.railroads,
+        "utilities": board.utilities,
+        "chance_spaces": board.chance_spaces,
+        "community_chest_spaces": board.community_chest_spaces,
+        "cards": card_effects(),
+        "rules": [BOARD_SPACES, JAIL_POSITION, GO_TO_JAIL_POSITION, MAX_DOUBLES, JAIL_TURNS],
+    }
+    return hashlib.sha256(json.dumps(definition, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def landing_outcomes(board, position, effects):
+    # Final (position, probability, jailed) after landing on a space, drawing at most one card
+    if position == GO_TO_JAIL_POSITION:
+        return [(JAIL_POSITION, 1.0, True)]
+    if position in board.chance_spaces:
+        deck = effects[0]
+    elif position in board.community_chest_spaces:
+        deck = effects[1]
+    else:
+        return [(position, 1.0, False)]
+
+    outcomes = []
+    for op, arg, _ in deck:
+        p = 1.0 / len(deck)
+        if op == MOVE_TO:
+            outcomes.append((arg, p, False))
+        elif op == MOVE_REL:
+            target = (position + arg) % BOARD_SPACES
+            outcomes.append((target, p, target == GO_TO_JAIL_POSITION))
+        elif op == NEAREST_UTILITY:
+            target = min(board.utilities, key=lambda t: (t - position) % BOARD_SPACES)
+            outcomes.append((target, p, False))
+        elif op == NEAREST_RAILROAD:
+            target = min(board.railroads, key=lambda t: (t - position) % BOARD_SPACES)
+            outcomes.append((target, p, False))
+        elif op == JAIL:
+            outcomes.append((JAIL_POSITION, p, True))
+        else:
+            outcomes.append((position, p, False))
+    return outcomes
+
+
+def transition_matrix(board=None):
+    board = board if board is not None else Board(load_images=False)
+    effects = card_effects()
+    matrix = np.zeros((NUM_STATES, NUM_STATES))
+    rolls = [(a, b) for a in range(1, 7) for b in range(1, 7)]
+
+    def land(row, start, total, probability, next_doubles):
+        position = (start + total) % BOARD_SPACES
+        for final, p, jailed in landing_outcomes(board, position, effects):
+            if jailed:
+                matrix[row, jail_state(JAIL_TURNS)] += probability * p
+            else:
+                matrix[row, roll_state(final, next_doubles)] += probability * p
+
+    for position in range(BOARD_SPACES):
+        for doubles in range(MAX_DOUBLES):
+            row = roll_state(position, doubles)
+            for a, b in rolls:
+                if a == b and doubles + 1 == MAX_DOUBLES:
+                    matrix[row, jail_state(JAIL_TURNS)] += 1 / 36
+                else:
+                    land(row, position, a + b, 1 / 36, doubles + 1 if a == b else 0)
+
+    for turns_left in range(1, JAIL_TURNS + 1):
+        row = jail_state(turns_left)
+        for a, b in rolls:
+            if a == b or turns_left == 1:
+                land(row, JAIL_POSITION, a + b, 1 / 36, 0)
+            else:
+                matrix[row, jail_state(turns_left - 1)] += 1 / 36
+    return matrix
+
+
+def stationary_distribution(matrix):
+    # Solve pi P = pi with sum(pi) = 1 by replacing one balance equation
+    n = matrix.shape[0]
+    system = matrix.T - np.eye(n)
+    system[-1, :] = 1.0
+    rhs = np.zeros(n)
+    rhs[-1] = 1.0
+    return np.linalg.solve(system, rhs)
+
+
+def solve(board):
+    pi = stationary_distribution(transition_matrix(board))
+    spaces = pi[:NUM_ROLL_STATES].reshape(BOARD_SPACES, MAX_DOUBLES).sum(axis=1)
+    in_jail = float(pi[NUM_ROLL_STATES:].sum())
+    just_visiting = float(spaces[JAIL_POSITION])
+    spaces[JAIL_POSITION] += in_jail
+    return {"spaces": spaces.tolist(), "in_jail": in_jail, "just_visiting": just_visiting}
+
+
+# In-process memo keyed by definition hash, backed by JSON files in CACHE_DIR
+_results = {}
+
+
+def landing_probabilities(board=None, use_disk=True):
+    # Long-run probability of ending a roll on each space (jail includes "in jail")
+    board = board if board is not None else Board(load_images=False)
+    key = definition_hash(board)
+    if key not in _results:
+        path = os.path.join(CACHE_DIR, f"landing_{key}.json")
+        if use_disk and os.path.exists(path):
+            with open(path) as f:
+                _results[key] = json.load(f)
+        else:
+            _results[key] = solve(board)
+            if use_disk:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(path, "w") as f:
+                    json.dump(_results[key], f)
+    return _results[key]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact long-run landing probabilities")
+    parser.add_argument("--no-cache", action="store_true", help="solve without reading or writing the disk cache")
+    args = parser.parse_args(argv)
+
+    board = Board(load_images=False)
+    result = landing_probabilities(board, use_disk=not args.no_cache)
+    names = space_names(board)
+    ranked = sorted(range(BOARD_SPACES), key=lambda i: result["spaces"][i], reverse=True)
+    for position in ranked:
+        print(f"{position:2d}  {names[position]:<28} {100 * result['spaces'][position]:6.3f}%")
+    print(f"In jail: {100 * result['in_jail']:.3f}%  Just visiting: {100 * result['just_visiting']:.3f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+import atlas
+
+IMAGE_DIR = "assets/images"
+
+# Process-wide image cache: every file is decoded once per (path, size) and
+# missing files are remembered, so a new game never goes back to the disk
+_images = {}  # (path, size) -> converted surface, or None if the file is missing
+_sources = {}  # path -> decoded file at its own size, scaled from for every size
+_pending = {}  # (path, size) -> Future decoding on the background thread
+_listings = {}  # directory -> set of file names, or empty set if it does not exist
+_lock = threading.Lock()
+_executor = None
+_atlas = None  # atlas.Atlas once loaded, False when none was generated
+_stats = {"atlas": 0, "decodes": 0, "loads": 0, "hits": 0, "missing": 0}
+
+
+def image_path(*parts):
+    return os.path.join(IMAGE_DIR, *parts)
+
+
+def slug(name):
+    return name.lower().replace(' ', '_')
+
+
+def exists(path):
+    # One directory listing per directory instead of a probe per file
+    directory, name = os.path.split(path)
+    with _lock:
+        listing = _listings.get(directory)
+        if listing is None:
+            try:
+                listing = set(os.listdir(directory or "."))
+            except OSError:
+                listing = set()
+            _listings[directory] = listing
+    return name in listing
+
+
+def get_atlas():
+    global _atlas
+    if _atlas is None:
+        _atlas = atlas.load_atlas() or False
+    return _atlas
+
+
+def from_atlas(key):
+    # Pre-scaled and already converted: no decode, scale or conversion
+    packed = get_atlas()
+    image = packed.get(*key) if packed else None
+    if image is not None:
+        _stats["atlas"] += 1
+        _images[key] = image
+    return image
+
+
+def decode(path, size):
+    # Safe off the main thread: no display access
+    if not exists(path):
+        return None
+    with _lock:
+        image = _sources.get(path)
+    if image is None:
+        image = pygame.image.load(path)
+        with _lock:
+            _sources[path] = image
+            _stats["decodes"] += 1
+    if size and image.get_size() != tuple(size):
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+def finish(key, image):
+    # Conversion to the display format happens on the main thread
+    if image is None:
+        _stats["missing"] += 1
+    else:
+        _stats["loads"] += 1
+        if pygame.display.get_surface():
+            image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+    _images[key] = image
+    return image
+
+
+def load_image(path, size=None):
+    # Blocking load for images needed right away; None if the file is
+    # missing or unreadable
+    key = (path, tuple(size) if size else None)
+    if key in _images:
+        _stats["hits"] += 1
+        return _images[key]
+    image = from_atlas(key)
+    if image is not None:
+        return image
+    future = _pending.pop(key, None)
+    try:
+        image = future.result() if future else decode(path, key[1])
+    except (pygame.error, OSError):
+        image = None  # Unreadable files count as missing
+    return finish(key, image)
+
+
+def get_image(path, size=None):
+    # Non-blocking: the image if it is ready, otherwise None while it loads
+    # in the background (or for good, if the file is missing)
+    key = (path, tuple(size) if size else None)
+    if key in _images:
+        _stats["hits"] += 1
+        return _images[key]
+    future = _pending.get(key)
+    if future is None:
+        image = from_atlas(key)
+        if image is not None:
+            return image
+        preload([(path, size)])
+        future = _pending.get(key)
+    if future is None or not future.done():
+        return None
+    del _pending[key]
+    try:
+        image = future.result()
+    except (pygame.error, OSError):
+        image = None  # Unreadable files count as missing
+    return finish(key, image)
+
+
+def is_loading(path, size=None):
+    return (path, tuple(size) if size else None) in _pending
+
+
+def preload(requests):
+    # Decode (path, size) pairs on a background thread
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets")
+    for path, size in requests:
+        key = (path, tuple(size) if size else None)
+        if key in _images or key in _pending or from_atlas(key) is not None:
+            continue
+        if not exists(path):
+            finish(key, None)
+            continue
+        _pending[key] = _executor.submit(decode, path, key[1])
+
+
+def clear():
+    global _atlas
+    _atlas = None
+    _images.clear()
+    _pending.clear()
+    with _lock:
+        _sources.clear()
+        _listings.clear()
+
+
+def stats():
+    return dict(_stats, cached=len(_images), pending=len(_pending))
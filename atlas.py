@@ -0,0 +1,122 @@
+import os
+import glob
+import json
+import mmap
+import pygame
+
+IMAGE_DIR = "assets/images"
+INDEX_PATH = "assets/atlas.json"
+MAX_WIDTH = 1024
+PADDING = 1
+
+# Every image the game draws, at each size it is drawn at, is packed
+# pre-scaled so nothing is decoded or scaled at runtime
+ATLAS_SIZES = [
+    ("dice*.png", [(40, 40), (60, 60)]),
+    ("corners/*.png", [(60, 60)]),
+    ("cards/*.png", [(200, 120)]),
+]
+
+
+def atlas_entries():
+    entries = []
+    for pattern, sizes in ATLAS_SIZES:
+        for path in sorted(glob.glob(os.path.join(IMAGE_DIR, pattern))):
+            for size in sizes:
+                entries.append((os.path.normpath(path), size))
+    return entries
+
+
+def pack(sizes, max_width=MAX_WIDTH):
+    # Shelf packing, tallest first; returns positions in input order and the atlas size
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:
+            y += shelf_height + PADDING
+            x = shelf_height = 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        width = max(width, x - PADDING)
+        shelf_height = max(shelf_height, h)
+    return positions, (width, y + shelf_height)
+
+
+def build_atlas(index_path=INDEX_PATH, raw=True):
+    # Writes the atlas PNG, optionally the same pixels as raw RGBA for
+    # mmap + frombuffer loading, and a JSON index of path/size -> rect
+    entries = atlas_entries()
+    images = {}
+    for path, size in entries:
+        if path not in images:
+            images[path] = pygame.image.load(path)
+    positions, (width, height) = pack([size for _, size in entries])
+
+    surface = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+    index = []
+    for (path, size), (x, y) in zip(entries, positions):
+        image = images[path]
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        surface.blit(image, (x, y))
+        index.append({"path": path.replace(os.sep, "/"), "size": list(size), "rect": [x, y, *size]})
+
+    base = os.path.splitext(index_path)[0]
+    data = {"width": surface.get_width(), "height": surface.get_height(), "format": "RGBA",
+            "image": os.path.basename(base + ".png"), "raw": None, "entries": index}
+    pygame.image.save(surface, base + ".png")
+    if raw:
+        with open(base + ".rgba", "wb") as f:
+            f.write(pygame.image.tobytes(surface, "RGBA"))
+        data["raw"] = os.path.basename(base + ".rgba")
+    with open(index_path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    return data
+
+
+class Atlas:
+    def __init__(self, surface, rects, buffer=None):
+        self.surface = surface
+        self.rects = rects  # (path, size) -> Rect
+        self.buffer = buffer  # Keeps an mmap alive while the surface wraps it
+
+    def get(self, path, size):
+        rect = self.rects.get((os.path.normpath(path), tuple(size) if size else None))
+        if rect is None:
+            return None
+        # Subsurfaces share the atlas pixels
+        return self.surface.subsurface(rect)
+
+
+def load_atlas(index_path=INDEX_PATH):
+    # None when no atlas has been generated
+    try:
+        with open(index_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    directory = os.path.dirname(index_path)
+    size = (data["width"], data["height"])
+
+    surface = buffer = None
+    raw_path = data.get("raw") and os.path.join(directory, data["raw"])
+    if raw_path and os.path.exists(raw_path) and os.path.getsize(raw_path) == size[0] * size[1] * 4:
+        # Raw pixels map straight into a surface: no PNG decode
+        with open(raw_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        surface = pygame.image.frombuffer(buffer, size, "RGBA")
+    else:
+        try:
+            surface = pygame.image.load(os.path.join(directory, data["image"]))
+        except (pygame.error, OSError):
+            return None
+
+    if pygame.display.get_surface():
+        # One conversion for every image in the atlas
+        surface = surface.convert_alpha()
+        buffer = None
+    rects = {(os.path.normpath(entry["path"]), tuple(entry["size"])): pygame.Rect(entry["rect"])
+             for entry in data["entries"]}
+    return Atlas(surface, rects, buffer)
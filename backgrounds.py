@@ -0,0 +1,38 @@
+import pygame
+
+# Gradients and translucent overlays are built once per (size, colours)
+_gradients = {}
+_overlays = {}
+
+
+def get_vertical_gradient(size, top_color, bottom_color):
+    key = (tuple(size), tuple(top_color), tuple(bottom_color))
+    surface = _gradients.get(key)
+    if surface is None:
+        width, height = size
+        # Paint a one-pixel column, then stretch it sideways
+        column = pygame.Surface((1, height))
+        for y in range(height):
+            t = y / height
+            color = tuple(int(top + (bottom - top) * t) for top, bottom in zip(top_color, bottom_color))
+            column.set_at((0, y), color)
+        surface = pygame.transform.scale(column, (width, height))
+        if pygame.display.get_surface():
+            surface = surface.convert()
+        _gradients[key] = surface
+    return surface
+
+
+def get_overlay(size, color):
+    key = (tuple(size), tuple(color))
+    surface = _overlays.get(key)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(color)
+        _overlays[key] = surface
+    return surface
+
+
+def clear():
+    _gradients.clear()
+    _overlays.clear()
@@ -0,0 +1,343 @@
+import os
+import time
+import argparse
+import numpy as np
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from board import Board
+from cards import (create_chance_cards, create_community_chest_cards, MOVE_TO, MOVE_REL, NEAREST_UTILITY,
+                   NEAREST_RAILROAD, CASH, JAIL, JAIL_CARD, REPAIRS, PAY_EACH, MAX_ARGS)
+from engine import (STARTING_MONEY, BOARD_SPACES, GO_SALARY, JAIL_POSITION,
+                    GO_TO_JAIL_POSITION, JAIL_FINE, MAX_DOUBLES, TAXES)
+
+class BoardTables:
+    # Flat lookup tables compiled from the same definitions as Board.__init__
+    def __init__(self, board=None):
+        board = board if board is not None else Board(load_images=False)
+        properties = board.properties
+        self.num_properties = len(properties)
+        self.prices = np.array([p.price for p in properties], dtype=np.int64)
+        self.positions = np.array([p.position for p in properties], dtype=np.int64)
+
+        # Rent tables from Property.rents. Streets by houses (0-4, 5 = hotel)
+        # plus the monopoly rent; railroads and utilities by the number the
+        # owner has in the group, read off the group bitmask with a popcount
+        # table, and utilities multiplied by the dice
+        self.group = np.array([p.group for p in properties], dtype=np.int64)
+        self.group_bit = np.array([p.group_bit for p in properties], dtype=np.int64)
+        self.group_full = np.array([p.group_full for p in properties], dtype=np.int64)
+        self.num_groups = int(self.group.max()) + 1
+        self.popcount = np.array([bin(mask).count("1") for mask in range(int(self.group_full.max()) + 1)],
+                                 dtype=np.int64)
+        self.by_count = np.array([p.kind != "street" for p in properties])
+        self.per_dice = np.array([p.kind == "utility" for p in properties])
+        self.rents = np.zeros((self.num_properties, 6), dtype=np.int64)
+        self.monopoly_rents = np.zeros(self.num_properties, dtype=np.int64)
+        self.count_rents = np.zeros((self.num_properties, self.popcount.max() + 1), dtype=np.int64)
+        for i, property in enumerate(properties):
+            if property.kind == "street":
+                self.rents[i] = (property.rents[0], *property.rents[2:])
+                self.monopoly_rents[i] = property.rents[1]
+            else:
+                self.count_rents[i, 1:len(property.rents) + 1] = property.rents
+
+        self.space_property = np.full(BOARD_SPACES, -1, dtype=np.int64)
+        self.space_property[self.positions] = np.arange(self.num_properties)
+        self.space_tax = np.zeros(BOARD_SPACES, dtype=np.int64)
+        for position, amount in TAXES.items():
+            self.space_tax[position] = amount
+        self.space_deck = np.full(BOARD_SPACES, -1, dtype=np.int64)
+        self.space_deck[board.chance_spaces] = 0
+        self.space_deck[board.community_chest_spaces] = 1
+
+        # Distance-free "next railroad / utility" lookups for every space
+        self.next_railroad = self.next_of(board.railroads)
+        self.next_utility = self.next_of(board.utilities)
+
+        # Card effects as (deck, card) -> opcode / arguments, straight from the cards
+        decks = [create_chance_cards(), create_community_chest_cards()]
+        self.deck_size = max(len(deck) for deck in decks)
+        self.card_ops = np.zeros((2, self.deck_size), dtype=np.int64)
+        self.card_args = np.zeros((2, self.deck_size, MAX_ARGS), dtype=np.int64)
+        for d, deck in enumerate(decks):
+            for c, card in enumerate(deck):
+                self.card_ops[d, c], *self.card_args[d, c] = card.effect
+
+    @staticmethod
+    def next_of(targets):
+        return np.array([min(targets, key=lambda t: (t - pos) % BOARD_SPACES)
+                         for pos in range(BOARD_SPACES)], dtype=np.int64)
+
+
+class BatchSimulator:
+    # B games held as arrays and advanced in lockstep, one turn per step()
+    def __init__(self, batch_size, num_players=4, seed=None, tables=None,
+                 starting_money=STARTING_MONEY, max_turns=1000):
+        self.tables = tables if tables is not None else BoardTables()
+        self.batch_size = batch_size
+        self.num_players = num_players
+        self.starting_money = starting_money
+        self.max_turns = max_turns
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        B, P, T = self.batch_size, self.num_players, self.tables
+        self.rng = np.random.default_rng(seed)
+        self.games = np.arange(B)
+        self.positions = np.zeros((B, P), dtype=np.int64)
+        self.cash = np.full((B, P), self.starting_money, dtype=np.int64)
+        self.jail = np.zeros((B, P), dtype=np.int64)
+        self.jail_cards = np.zeros((B, P), dtype=np.int64)
+        self.bankrupt = np.zeros((B, P), dtype=bool)
+        self.owner = np.full((B, T.num_properties), -1, dtype=np.int64)
+        self.group_masks = np.zeros((B, P, T.num_groups), dtype=np.int64)
+        self.houses = np.zeros((B, T.num_properties), dtype=np.int64)
+        self.current = np.zeros(B, dtype=np.int64)
+        self.doubles = np.zeros(B, dtype=np.int64)
+        self.turns = np.zeros(B, dtype=np.int64)
+        self.landings = np.zeros(BOARD_SPACES, dtype=np.int64)
+        # Per-game deck order (deck, card slot), draw cursor per deck and the
+        # player holding each card out of the deck (-1 while in circulation),
+        # as in cards.CardDeck
+        order = np.tile(np.arange(T.deck_size), (B, 2, 1))
+        self.deck_order = self.rng.permuted(order, axis=2)
+        self.deck_cursor = np.zeros((B, 2), dtype=np.int64)
+        self.deck_holder = np.full((B, 2, T.deck_size), -1, dtype=np.int64)
+
+    def active(self):
+        alive = (~self.bankrupt).sum(axis=1)
+        return (alive > 1) & (self.turns < self.max_turns)
+
+    def step(self):
+        T = self.tables
+        g = np.flatnonzero(self.active())
+        if g.size == 0:
+            return False
+        p = self.current[g]
+        dice = self.rng.integers(1, 7, size=(g.size, 2))
+        total = dice.sum(axis=1)
+        doubles = dice[:, 0] == dice[:, 1]
+        extra_turn = np.zeros(g.size, dtype=bool)
+
+        # Jail: use a card, roll doubles, or serve a turn (paying on the last)
+        in_jail = self.jail[g, p] > 0
+        has_card = in_jail & (self.jail_cards[g, p] > 0)
+        self.jail_cards[g[has_card], p[has_card]] -= 1
+        self.release_jail_card(g[has_card], p[has_card])
+        served = in_jail & ~has_card & ~doubles
+        self.jail[g[served], p[served]] -= 1
+        fined = served & (self.jail[g, p] == 0)
+        self.cash[g[fined], p[fined]] -= JAIL_FINE
+        released = in_jail & (has_card | doubles | fined)
+        self.jail[g[released], p[released]] = 0
+
+        # Free players: third double goes straight to jail
+        free = ~in_jail
+        self.doubles[g[free & doubles]] += 1
+        speeding = free & (self.doubles[g] >= MAX_DOUBLES)
+        self.send_to_jail(g[speeding], p[speeding])
+
+        movers = released | (free & ~speeding)
+        self.move(g[movers], p[movers], total[movers])
+        self.resolve(g[movers], p[movers], total[movers], allow_card=True)
+        extra_turn[free & ~speeding & doubles] = True
+        extra_turn &= self.jail[g, p] == 0
+
+        self.landings += np.bincount(self.positions[g, p], minlength=BOARD_SPACES)
+
+        # Bankruptcy returns all property to the bank
+        broke = self.cash[g, p] < 0
+        gb, pb = g[broke], p[broke]
+        self.bankrupt[gb, pb] = True
+        released_props = self.owner[gb] == pb[:, None]
+        self.owner[gb] = np.where(released_props, -1, self.owner[gb])
+        self.houses[gb] = np.where(released_props, 0, self.houses[gb])
+        self.group_masks[gb, pb] = 0
+        self.jail_cards[gb, pb] = 0
+        held = self.deck_holder[gb] == pb[:, None, None]
+        self.deck_holder[gb] = np.where(held, -1, self.deck_holder[gb])
+
+        self.turns[g] += 1
+        advance = ~extra_turn | broke
+        self.next_player(g[advance])
+        return True
+
+    def move(self, g, p, spaces):
+        start = self.positions[g, p]
+        end = (start + spaces) % BOARD_SPACES
+        passed = (spaces > 0) & (end < start)
+        self.cash[g, p] += passed * GO_SALARY
+        self.positions[g, p] = end
+
+    def send_to_jail(self, g, p):
+        self.positions[g, p] = JAIL_POSITION
+        self.jail[g, p] = 3
+        self.doubles[g] = 0
+
+    def resolve(self, g, p, total, allow_card):
+        T = self.tables
+        pos = self.positions[g, p]
+
+        to_jail = pos == GO_TO_JAIL_POSITION
+        self.send_to_jail(g[to_jail], p[to_jail])
+
+        self.cash[g, p] -= T.space_tax[pos]
+
+        deck = T.space_deck[pos]
+        if allow_card:
+            drawing = deck >= 0
+            self.draw_cards(g[drawing], p[drawing], deck[drawing])
+            pos = self.positions[g, p]
+            self.resolve(g[drawing], p[drawing], total[drawing], allow_card=False)
+            landed = ~drawing
+        else:
+            landed = np.ones(g.size, dtype=bool)
+
+        prop = T.space_property[pos]
+        landed &= prop >= 0
+        g, p, prop, total = g[landed], p[landed], prop[landed], total[landed]
+        owner = self.owner[g, prop]
+
+        # Unowned: buy if affordable (the engine's default always_buy policy)
+        buying = (owner < 0) & (self.cash[g, p] >= T.prices[prop])
+        self.owner[g[buying], prop[buying]] = p[buying]
+        self.cash[g[buying], p[buying]] -= T.prices[prop[buying]]
+        self.group_masks[g[buying], p[buying], T.group[prop[buying]]] |= T.group_bit[prop[buying]]
+
+        # Owned by someone else: pay rent from the tables
+        paying = (owner >= 0) & (owner != p)
+        gp, pp, prp, op = g[paying], p[paying], prop[paying], owner[paying]
+        mask = self.group_masks[gp, op, T.group[prp]]
+        houses = self.houses[gp, prp]
+        street = np.where((houses == 0) & (mask == T.group_full[prp]), T.monopoly_rents[prp], T.rents[prp, houses])
+        counted = T.count_rents[prp, T.popcount[mask]] * np.where(T.per_dice[prp], total[paying], 1)
+        rent = np.where(T.by_count[prp], counted, street)
+        self.cash[gp, pp] -= rent
+        self.cash[gp, op] += rent
+
+    def shuffle(self, g, deck):
+        T = self.tables
+        order = np.tile(np.arange(T.deck_size), (g.size, 1))
+        self.deck_order[g, deck] = self.rng.permuted(order, axis=1)
+        self.deck_cursor[g, deck] = 0
+
+    def draw(self, g, deck):
+        # Next card index per game: a game's deck reshuffles once every card
+        # has been drawn, and cards held by players are skipped
+        T = self.tables
+        card = np.empty(g.size, dtype=np.int64)
+        pending = np.arange(g.size)
+        while pending.size:
+            gp, dp = g[pending], deck[pending]
+            empty = self.deck_cursor[gp, dp] == T.deck_size
+            self.shuffle(gp[empty], dp[empty])
+            cursor = self.deck_cursor[gp, dp]
+            drawn = self.deck_order[gp, dp, cursor]
+            self.deck_cursor[gp, dp] = cursor + 1
+            card[pending] = drawn
+            pending = pending[self.deck_holder[gp, dp, drawn] >= 0]
+        return card
+
+    def release_jail_card(self, g, p):
+        # Puts one card held by each player back, Chance first like
+        # GameEngine.return_jail_card
+        T = self.tables
+        held = (self.deck_holder[g] == p[:, None, None]).reshape(g.size, 2 * T.deck_size)
+        slot = held.argmax(axis=1)
+        found = held[np.arange(g.size), slot]
+        g, slot = g[found], slot[found]
+        self.deck_holder[g, slot // T.deck_size, slot % T.deck_size] = -1
+
+    def draw_cards(self, g, p, deck):
+        # Vectorized executor for the card opcodes, one drawn card per game
+        T = self.tables
+        card = self.draw(g, deck)
+        op = T.card_ops[deck, card]
+        arg = T.card_args[deck, card, 0]
+        arg2 = T.card_args[deck, card, 1]
+        start = self.positions[g, p]
+
+        target = np.select([op == MOVE_TO, op == NEAREST_UTILITY, op == NEAREST_RAILROAD,
+                            op == MOVE_REL],
+                           [arg, T.next_utility[start], T.next_railroad[start],
+                            (start + arg) % BOARD_SPACES],
+                           start)
+        advancing = (op == MOVE_TO) | (op == NEAREST_UTILITY) | (op == NEAREST_RAILROAD)
+        self.cash[g, p] += (advancing & (target < start)) * GO_SALARY
+        self.positions[g, p] = target
+
+        cash = op == CASH
+        paid = cash & ((arg >= 0) | (self.cash[g, p] >= -arg))
+        self.cash[g[paid], p[paid]] += arg[paid]
+
+        jailed = op == JAIL
+        self.send_to_jail(g[jailed], p[jailed])
+
+        cards = op == JAIL_CARD
+        self.jail_cards[g[cards], p[cards]] += 1
+        self.deck_holder[g[cards], deck[cards], card[cards]] = p[cards]
+
+        repairs = op == REPAIRS
+        gr, pr = g[repairs], p[repairs]
+        owned = self.owner[gr] == pr[:, None]
+        houses = self.houses[gr]
+        # Charged in full, like the engine; the payer may go broke
+        cost = (owned * np.where(houses == 5, arg2[repairs, None], houses * arg[repairs, None])).sum(axis=1)
+        self.cash[gr, pr] -= cost
+
+        # Every other player still in the game is paid; the payer may go broke
+        paying = op == PAY_EACH
+        gp, pp, amount = g[paying], p[paying], arg[paying]
+        others = ~self.bankrupt[gp]
+        others[np.arange(gp.size), pp] = False
+        self.cash[gp] += others * amount[:, None]
+        self.cash[gp, pp] -= others.sum(axis=1) * amount
+
+    def next_player(self, g):
+        P = self.num_players
+        self.doubles[g] = 0
+        current = self.current[g]
+        chosen = current.copy()
+        found = np.zeros(g.size, dtype=bool)
+        for step in range(1, P + 1):
+            candidate = (current + step) % P
+            ok = ~found & ~self.bankrupt[g, candidate]
+            chosen[ok] = candidate[ok]
+            found |= ok
+        self.current[g] = chosen
+
+    def run(self):
+        while self.step():
+            pass
+        return self
+
+    def winners(self):
+        # Seat index of the last player standing, -1 for unfinished games
+        alive = ~self.bankrupt
+        return np.where(alive.sum(axis=1) == 1, alive.argmax(axis=1), -1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Advance a batch of games in lockstep with NumPy")
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    sim = BatchSimulator(args.batch, args.players, args.seed, max_turns=args.max_turns).run()
+    elapsed = time.perf_counter() - start_time
+
+    winners = sim.winners()
+    print(f"Games: {args.batch}  Turns: {sim.turns.sum()}  Unfinished: {(winners < 0).sum()}")
+    for seat in range(args.players):
+        wins = (winners == seat).sum()
+        print(f"  Player {seat+1}: {wins} wins ({100 * wins / args.batch:.1f}%)")
+    print(f"Elapsed: {elapsed:.2f}s  ({args.batch / elapsed:.0f} games/sec, "
+          f"{sim.turns.sum() / elapsed:.0f} turns/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+DEFAULT_TRIALS = 7
+DEFAULT_THRESHOLD = 0.10  # Slowdown that counts as a regression
+COMPARE_METRIC = "min_us"  # Best trial: the least sensitive to background load
+TRIAL_SECONDS = 0.2  # Each trial repeats the case for at least this long
+
+# name -> function(game) returning the callable to time; registered in order
+CASES = {}
+
+# Startup cases run in a fresh interpreter per trial and time themselves
+STARTUP_CASES = {
+    "startup.import_rules": "import engine\nassert 'pygame' not in sys.modules",
+    "startup.import_main": "import main",
+    "startup.first_frame": "import main\ngame = main.Game()\ngame.draw()",
+}
+STARTUP_TEMPLATE = "import sys, time\n_start = time.perf_counter()\n{code}\nprint(time.perf_counter() - _start)"
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def build_board(board, players):
+    # Every property owned, houses and hotels on the streets, some mortgaged
+    for i, property in enumerate(board.properties):
+        property.owner = players[i % len(players)]
+        if i % 5 == 4:
+            property.mortgaged = True
+        elif i % 3 == 0:
+            property.hotel = True
+        else:
+            property.houses = i % 5
+    board.invalidate()
+
+
+def make_players(count):
+    import main
+    colors = [main.RED, main.BLUE, main.GREEN, main.YELLOW, main.ORANGE, main.PURPLE]
+    players = [main.Player(f"Player {i+1}", colors[i], 500) for i in range(count)]
+    for i, player in enumerate(players):
+        player.position = i * 7
+    return players
+
+
+@case("board.draw.empty")
+def bench_board_empty(game):
+    board = game.board
+    board.invalidate()
+    return lambda: board.draw(game.screen, 0, [3, 4])
+
+
+@case("board.draw.built")
+def bench_board_built(game):
+    board = game.board
+    build_board(board, make_players(4))
+    return lambda: board.draw(game.screen, 0, [3, 4])
+
+
+@case("board.draw.tile_change")
+def bench_board_tile_change(game):
+    # One tile changes every frame, so the dirty-tile path runs each call
+    board = game.board
+    build_board(board, make_players(4))
+    property = board.properties[1]
+
+    def run():
+        property.mortgaged = not property.mortgaged
+        board.draw(game.screen, 0, [3, 4])
+    return run
+
+
+@case("board.render_layer")
+def bench_board_render_layer(game):
+    board = game.board
+    build_board(board, make_players(4))
+    return lambda: board.render_board_layer(600)
+
+
+@case("player.draw.1")
+def bench_player_1(game):
+    player = make_players(1)[0]
+    return lambda: player.draw(game.screen)
+
+
+@case("player.draw.6")
+def bench_player_6(game):
+    players = make_players(6)
+
+    def run():
+        for player in players:
+            player.draw(game.screen)
+    return run
+
+
+@case("dice.draw.roll")
+def bench_dice_roll(game):
+    # One call is a whole roll: every animation frame plus the settled dice
+    import main
+    dice = main.Dice()
+
+    def run():
+        random.seed(1)
+        dice.roll()
+        while True:
+            dice.draw(game.screen)
+            if dice.update():
+                break
+        dice.draw(game.screen)
+    return run
+
+
+def particle_case(count):
+    def setup(game):
+        from particles import ParticleSystem
+        system = ParticleSystem(capacity=count, lifetime=10 ** 9, seed=1)
+        rng = np.random.default_rng(1)
+        for _ in range(count // 10):
+            system.add_particles(rng.uniform(100, 1100), rng.uniform(100, 700),
+                                 tuple(rng.integers(0, 256, 3).tolist()), count=10, speed=0.5)
+
+        def run():
+            system.update()
+            system.draw(game.screen)
+        return run
+    return setup
+
+
+for _count in (100, 1000, 10000):
+    case(f"particles.{_count}")(particle_case(_count))
+
+
+@case("game.draw_menu")
+def bench_draw_menu(game):
+    return game.draw_menu
+
+
+@case("rules.get_property_at_position")
+def bench_property_lookup(game):
+    board = game.board
+
+    def run():
+        for position in range(40):
+            board.get_property_at_position(position)
+    return run
+
+
+@case("rules.get_rent")
+def bench_get_rent(game):
+    board = game.board
+    build_board(board, make_players(4))
+    properties = board.properties
+
+    def run():
+        for property in properties:
+            property.get_rent()
+    return run
+
+
+@case("rules.play_turn")
+def bench_play_turn(game):
+    from engine import GameEngine
+    engine = GameEngine(num_players=4, seed=1)
+
+    def run():
+        if engine.is_over() or engine.turn >= 1000:
+            engine.reset(1)
+        engine.play_turn()
+    return run
+
+
+def time_case(fn, trials, warmup=3):
+    for _ in range(warmup):
+        fn()
+    # Calibrate how many calls make up one trial
+    start = time.perf_counter()
+    fn()
+    single = time.perf_counter() - start
+    number = max(1, int(TRIAL_SECONDS / max(single, 1e-9)))
+
+    samples = []
+    for _ in range(trials):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return summarize(samples, number)
+
+
+def time_startup(code, trials):
+    samples = []
+    for _ in range(trials):
+        output = subprocess.run([sys.executable, "-c", STARTUP_TEMPLATE.format(code=code)],
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(float(output.split()[-1]))
+    return summarize(samples, 1)
+
+
+def summarize(samples, number):
+    trials = len(samples)
+    return {
+        "median_us": statistics.median(samples) * 1e6,
+        "min_us": min(samples) * 1e6,
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "stdev_us": statistics.stdev(samples) * 1e6 if len(samples) > 1 else 0.0,
+        "trials": trials,
+        "number": number,
+    }
+
+
+def make_game():
+    import main
+    if not os.path.exists("assets/images/dice1.png"):
+        sys.exit("Missing assets: run generate_assets.py first")
+    return main.Game()
+
+
+def run_benchmarks(names, trials=DEFAULT_TRIALS, progress=None):
+    results = {}
+    for name in names:
+        if name in STARTUP_CASES:
+            results[name] = time_startup(STARTUP_CASES[name], trials)
+            if progress:
+                progress(name, results[name])
+            continue
+        # Fresh game state per case so cases do not see each other's boards
+        game = make_game()
+        game.setup_players(4)
+        results[name] = time_case(CASES[name](game), trials)
+        if progress:
+            progress(name, results[name])
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        },
+        "results": results,
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    # Returns (lines, regressions), comparing the best trial case by case
+    lines = [f"{'case':<34}{'baseline us':>14}{'current us':>14}{'change':>10}"]
+    regressions = []
+    for name, current in results["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            lines.append(f"{name:<34}{'-':>14}{current[COMPARE_METRIC]:>14.1f}{'new':>10}")
+            continue
+        change = current[COMPARE_METRIC] / before[COMPARE_METRIC] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        lines.append(f"{name:<34}{before[COMPARE_METRIC]:>14.1f}{current[COMPARE_METRIC]:>14.1f}{change:>+10.1%}{flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark rendering and rules hot paths headlessly")
+    parser.add_argument("--output", help="write results as JSON to this file (use it to save a baseline)")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown of the best trial flagged as a regression (default 0.10 = 10%%)")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in [*CASES, *STARTUP_CASES] if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    def report(name, result):
+        print(f"{name:<34}{result['median_us']:>12.1f} us  (min {result['min_us']:.1f}, "
+              f"x{result['number']} per trial)", file=sys.stderr)
+
+    results = run_benchmarks(names, args.trials, progress=report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        lines, regressions = compare(results, baseline, args.threshold)
+        print("\n".join(lines), file=sys.stderr)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,37 @@
-import pygame
 import math
 from properties import Property
+from lazy import lazy_import
+
+# Rendering modules load on first draw; the rules engine never needs them
+pygame = lazy_import("pygame")
+fonts = lazy_import("fonts")
+assets = lazy_import("assets")
+dice_atlas = lazy_import("dice_atlas")
+
+# Background colour per space kind; plain properties use their group colour
+SPACE_COLORS = {
+    "corner": (200, 200, 200),
+    "railroad": (180, 180, 180),
+    "utility": (220, 220, 220),
+    "tax": (240, 240, 240),
+    "chance": (255, 255, 200),
+    "community_chest": (200, 255, 200),
+}
+CORNER_NAMES = ["go", "jail", "free_parking", "go_to_jail"]
+LAYER_EDGE = 17  # Top and bottom rows of the board layer with see-through pixels
+RAILROAD_RENTS = (25, 50, 100, 200)  # By railroads owned
+UTILITY_MULTIPLIERS = (4, 10)  # Times the dice, by utilities owned
+
+class Space:
+    def __init__(self, position, kind, property=None, color=None, label=""):
+        self.position = position
+        self.kind = kind  # corner, railroad, utility, tax, chance, community_chest, property, empty
+        self.property = property
+        self.color = color
+        self.label = label
 
 class Board:
-    def __init__(self):
+    def __init__(self, load_images=True):
         self.properties = []
         self.corner_spaces = [0, 10, 20, 30]  # GO, Jail, Free Parking, Go to Jail
         self.railroads = [5, 15, 25, 35]  # Reading, Pennsylvania, B&O, Short Line
@@ -15,206 +43,321 @@ class Board:
         # Initialize all properties with official Monopoly values
         self.properties = [
             # Brown Properties
-            Property("Mediterranean Avenue", 60, (139, 69, 19), 1),
-            Property("Baltic Avenue", 60, (139, 69, 19), 3),
+            Property("Mediterranean Avenue", 60, (139, 69, 19), 1, (2, 10, 30, 90, 160, 250)),
+            Property("Baltic Avenue", 60, (139, 69, 19), 3, (4, 20, 60, 180, 320, 450)),
             
             # Light Blue Properties
-            Property("Oriental Avenue", 100, (173, 216, 230), 6),
-            Property("Vermont Avenue", 100, (173, 216, 230), 8),
-            Property("Connecticut Avenue", 120, (173, 216, 230), 9),
+            Property("Oriental Avenue", 100, (173, 216, 230), 6, (6, 30, 90, 270, 400, 550)),
+            Property("Vermont Avenue", 100, (173, 216, 230), 8, (6, 30, 90, 270, 400, 550)),
+            Property("Connecticut Avenue", 120, (173, 216, 230), 9, (8, 40, 100, 300, 450, 600)),
             
             # Pink Properties
-            Property("St. Charles Place", 140, (255, 192, 203), 11),
-            Property("States Avenue", 140, (255, 192, 203), 13),
-            Property("Virginia Avenue", 160, (255, 192, 203), 14),
+            Property("St. Charles Place", 140, (255, 192, 203), 11, (10, 50, 150, 450, 625, 750)),
+            Property("States Avenue", 140, (255, 192, 203), 13, (10, 50, 150, 450, 625, 750)),
+            Property("Virginia Avenue", 160, (255, 192, 203), 14, (12, 60, 180, 500, 700, 900)),
             
             # Orange Properties
-            Property("St. James Place", 180, (255, 165, 0), 16),
-            Property("Tennessee Avenue", 180, (255, 165, 0), 18),
-            Property("New York Avenue", 200, (255, 165, 0), 19),
+            Property("St. James Place", 180, (255, 165, 0), 16, (14, 70, 200, 550, 750, 950)),
+            Property("Tennessee Avenue", 180, (255, 165, 0), 18, (14, 70, 200, 550, 750, 950)),
+            Property("New York Avenue", 200, (255, 165, 0), 19, (16, 80, 220, 600, 800, 1000)),
             
             # Red Properties
-            Property("Kentucky Avenue", 220, (255, 0, 0), 21),
-            Property("Indiana Avenue", 220, (255, 0, 0), 23),
-            Property("Illinois Avenue", 240, (255, 0, 0), 24),
+            Property("Kentucky Avenue", 220, (255, 0, 0), 21, (18, 90, 250, 700, 875, 1050)),
+            Property("Indiana Avenue", 220, (255, 0, 0), 23, (18, 90, 250, 700, 875, 1050)),
+            Property("Illinois Avenue", 240, (255, 0, 0), 24, (20, 100, 300, 750, 925, 1100)),
             
             # Yellow Properties
-            Property("Atlantic Avenue", 260, (255, 255, 0), 26),
-            Property("Ventnor Avenue", 260, (255, 255, 0), 27),
-            Property("Marvin Gardens", 280, (255, 255, 0), 29),
+            Property("Atlantic Avenue", 260, (255, 255, 0), 26, (22, 110, 330, 800, 975, 1150)),
+            Property("Ventnor Avenue", 260, (255, 255, 0), 27, (22, 110, 330, 800, 975, 1150)),
+            Property("Marvin Gardens", 280, (255, 255, 0), 29, (24, 120, 360, 850, 1025, 1200)),
             
             # Green Properties
-            Property("Pacific Avenue", 300, (0, 255, 0), 31),
-            Property("North Carolina Avenue", 300, (0, 255, 0), 32),
-            Property("Pennsylvania Avenue", 320, (0, 255, 0), 34),
+            Property("Pacific Avenue", 300, (0, 255, 0), 31, (26, 130, 390, 900, 1100, 1275)),
+            Property("North Carolina Avenue", 300, (0, 255, 0), 32, (26, 130, 390, 900, 1100, 1275)),
+            Property("Pennsylvania Avenue", 320, (0, 255, 0), 34, (28, 150, 450, 1000, 1200, 1400)),
             
             # Blue Properties
-            Property("Park Place", 350, (0, 0, 255), 37),
-            Property("Boardwalk", 400, (0, 0, 255), 39),
+            Property("Park Place", 350, (0, 0, 255), 37, (35, 175, 500, 1100, 1300, 1500)),
+            Property("Boardwalk", 400, (0, 0, 255), 39, (50, 200, 600, 1400, 1700, 2000)),
             
             # Railroads
-            Property("Reading Railroad", 200, (128, 128, 128), 5),
-            Property("Pennsylvania Railroad", 200, (128, 128, 128), 15),
-            Property("B&O Railroad", 200, (128, 128, 128), 25),
-            Property("Short Line", 200, (128, 128, 128), 35),
+            Property("Reading Railroad", 200, (128, 128, 128), 5, RAILROAD_RENTS, "railroad"),
+            Property("Pennsylvania Railroad", 200, (128, 128, 128), 15, RAILROAD_RENTS, "railroad"),
+            Property("B&O Railroad", 200, (128, 128, 128), 25, RAILROAD_RENTS, "railroad"),
+            Property("Short Line", 200, (128, 128, 128), 35, RAILROAD_RENTS, "railroad"),
             
             # Utilities
-            Property("Electric Company", 150, (255, 255, 255), 12),
-            Property("Water Works", 150, (255, 255, 255), 28)
+            Property("Electric Company", 150, (255, 255, 255), 12, UTILITY_MULTIPLIERS, "utility"),
+            Property("Water Works", 150, (255, 255, 255), 28, UTILITY_MULTIPLIERS, "utility")
         ]
         
-        # Load and scale images
-        self.load_images()
+        self.compile_spaces()
         
-    def load_images(self):
-        # Load dice images
-        self.dice_images = []
-        for i in range(1, 7):
-            img = pygame.image.load(f"assets/images/dice{i}.png")
-            img = pygame.transform.scale(img, (40, 40))
-            self.dice_images.append(img)
-            
-        # Load property images
-        self.property_images = {}
-        for property in self.properties:
-            try:
-                img = pygame.image.load(f"assets/images/properties/{property.name.lower().replace(' ', '_')}.png")
-                img = pygame.transform.scale(img, (40, 40))
-                self.property_images[property.name] = img
-            except:
-                continue
-                
-        # Load corner images
-        self.corner_images = {}
-        corner_names = ["go", "jail", "free_parking", "go_to_jail"]
-        for name in corner_names:
-            try:
-                img = pygame.image.load(f"assets/images/corners/{name}.png")
-                img = pygame.transform.scale(img, (60, 60))
-                self.corner_images[name] = img
-            except:
-                continue
-    
-    def draw(self, screen, current_player, dice_roll):
-        board_size = 600
-        board_x = (screen.get_width() - board_size) // 2
-        board_y = (screen.get_height() - board_size) // 2
+        # Cached board layer, rebuilt on size change and patched per dirty tile
+        self.board_layer = None
+        self.board_layer_size = None
+        self.board_face = None  # Opaque display-format copy of the layer
+        self.layer_parts = []  # (surface, area) blits that put the layer on screen
+        self.tile_rects = []
+        self.tile_states = []
+        self.changed_rects = []
+        self.drawn_dice = None
+        self.drawn_dice_rect = None
         
-        # Draw board background with shadow
-        shadow_surface = pygame.Surface((board_size + 20, board_size + 20), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, (0, 0, 0, 100), 
-                        (10, 10, board_size, board_size), border_radius=10)
-        screen.blit(shadow_surface, (board_x - 10, board_y - 10))
+        # Load and scale images (skipped by the headless engine)
+        self.use_images = load_images
+        self.dice_images = []
+        if load_images:
+            self.load_images()
         
-        # Draw main board
-        pygame.draw.rect(screen, (255, 255, 255), 
-                        (board_x, board_y, board_size, board_size), border_radius=10)
+    def compile_spaces(self):
+        # Build the 40-entry space table and lookup indexes once, so every
+        # per-roll and per-frame lookup is a list index or dict hit
+        self.property_by_position = [None] * 40
+        self.property_by_name = {}
+        self.color_groups = {}
+        for property in self.properties:
+            self.property_by_position[property.position] = property
+            self.property_by_name[property.name] = property
+            self.color_groups.setdefault(property.color, []).append(property)
+        # Each group gets an index and each property a bit within it, so
+        # owners can track groups as bitmasks (see Property.owner)
+        for group, members in enumerate(self.color_groups.values()):
+            counts = tuple(bin(mask).count("1") for mask in range(1 << len(members)))
+            for i, property in enumerate(members):
+                property.group = group
+                property.group_bit = 1 << i
+                property.group_full = (1 << len(members)) - 1
+                property.group_counts = counts
         
-        # Draw properties
+        self.spaces = []
         for i in range(40):
-            x, y = self.get_space_coordinates(board_x, board_y, board_size, i)
-            
-            # Draw space background
+            property = self.property_by_position[i]
             if i in self.corner_spaces:
-                pygame.draw.rect(screen, (200, 200, 200), (x, y, 60, 60))
+                name = CORNER_NAMES[self.corner_spaces.index(i)]
+                space = Space(i, "corner", None, SPACE_COLORS["corner"], name.replace('_', ' ').title())
             elif i in self.railroads:
-                pygame.draw.rect(screen, (180, 180, 180), (x, y, 60, 60))
+                space = Space(i, "railroad", property, SPACE_COLORS["railroad"], property.name if property else "")
             elif i in self.utilities:
-                pygame.draw.rect(screen, (220, 220, 220), (x, y, 60, 60))
+                space = Space(i, "utility", property, SPACE_COLORS["utility"], property.name if property else "")
             elif i in self.tax_spaces:
-                pygame.draw.rect(screen, (240, 240, 240), (x, y, 60, 60))
+                space = Space(i, "tax", None, SPACE_COLORS["tax"], "Tax")
             elif i in self.chance_spaces:
-                pygame.draw.rect(screen, (255, 255, 200), (x, y, 60, 60))
+                space = Space(i, "chance", None, SPACE_COLORS["chance"], "Chance")
             elif i in self.community_chest_spaces:
-                pygame.draw.rect(screen, (200, 255, 200), (x, y, 60, 60))
+                space = Space(i, "community_chest", None, SPACE_COLORS["community_chest"], "Community Chest")
+            elif property:
+                space = Space(i, "property", property, property.color, property.name)
             else:
-                property = self.get_property_at_position(i)
-                if property:
-                    pygame.draw.rect(screen, property.color, (x, y, 60, 60))
-            
-            # Draw space border
-            pygame.draw.rect(screen, (0, 0, 0), (x, y, 60, 60), 1)
-            
-            # Draw space content
-            if i in self.corner_spaces:
-                self.draw_corner_space(screen, x, y, i)
-            elif i in self.railroads:
-                self.draw_railroad_space(screen, x, y, i)
-            elif i in self.utilities:
-                self.draw_utility_space(screen, x, y, i)
-            elif i in self.tax_spaces:
-                self.draw_tax_space(screen, x, y, i)
-            elif i in self.chance_spaces:
-                self.draw_chance_space(screen, x, y)
-            elif i in self.community_chest_spaces:
-                self.draw_community_chest_space(screen, x, y)
-            else:
-                property = self.get_property_at_position(i)
-                if property:
-                    self.draw_property_space(screen, x, y, property)
+                space = Space(i, "empty")
+            self.spaces.append(space)
+    
+    def load_images(self):
+        # Dice are drawn on the first frame; corner art decodes in the background
+        # and each corner tile is re-rendered when its image arrives
+        # A missing or unreadable dice image is drawn instead
+        self.dice_images = [assets.load_image(assets.image_path(f"dice{i}.png"), (40, 40))
+                            or dice_atlas.get_face(40, i, 0) for i in range(1, 7)]
+        assets.preload([(assets.image_path("corners", f"{name}.png"), (60, 60)) for name in CORNER_NAMES])
+    
+    def get_corner_image(self, position):
+        if not self.use_images:
+            return None
+        name = CORNER_NAMES[self.corner_spaces.index(position)]
+        return assets.get_image(assets.image_path("corners", f"{name}.png"), (60, 60))
+    
+    def draw(self, screen, current_player, dice_roll):
+        board_size = 600
+        board_x = (screen.get_width() - board_size) // 2
+        board_y = (screen.get_height() - board_size) // 2
+        
+        # The whole board is a cached layer; only changed tiles get re-rendered
+        self.get_board_layer(board_size)
+        for surface, area in self.layer_parts:
+            screen.blit(surface, (board_x - 10 + area.x, board_y - 10 + area.y), area)
+        dirty = [rect.move(board_x - 10, board_y - 10) for rect in self.changed_rects]
         
         # Draw dice if rolled
+        dice_rect = None
         if dice_roll:
             dice_x = board_x + board_size + 20
             dice_y = board_y + board_size - 100
             for i, value in enumerate(dice_roll):
                 screen.blit(self.dice_images[value-1], (dice_x + i*50, dice_y))
+            dice_rect = pygame.Rect(dice_x, dice_y, 50 * len(dice_roll), 40)
+        dice_state = tuple(dice_roll) if dice_roll else None
+        if dice_state != self.drawn_dice:
+            dirty.extend(rect for rect in (self.drawn_dice_rect, dice_rect) if rect)
+        self.drawn_dice = dice_state
+        self.drawn_dice_rect = dice_rect
+        
+        # Screen rects that differ from the previous frame
+        return dirty
+    
+    def get_board_layer(self, board_size):
+        if self.board_layer is None or self.board_layer_size != board_size:
+            self.render_board_layer(board_size)
+            if pygame.display.get_surface():
+                self.split_layer()
+            self.changed_rects = [self.board_layer.get_rect()]
+            return self.board_layer
+        
+        self.changed_rects = []
+        for space in self.spaces:
+            state = self.get_tile_state(space)
+            if state != self.tile_states[space.position]:
+                self.tile_states[space.position] = state
+                self.redraw_tile(space.position)
+                self.changed_rects.append(self.tile_rects[space.position])
+        return self.board_layer
+    
+    def invalidate(self):
+        self.board_layer = None
+    
+    def render_board_layer(self, board_size):
+        # Layer is board-sized plus a 10px margin for the shadow
+        layer = pygame.Surface((board_size + 20, board_size + 20), pygame.SRCALPHA)
+        pygame.draw.rect(layer, (0, 0, 0, 100), 
+                        (10, 10, board_size, board_size), border_radius=10)
+        pygame.draw.rect(layer, (255, 255, 255), 
+                        (10, 10, board_size, board_size), border_radius=10)
+        
+        self.board_layer = layer
+        self.board_layer_size = board_size
+        self.board_face = None
+        self.layer_parts = [(layer, layer.get_rect())]
+        self.tile_rects = []
+        self.tile_states = []
+        for space in self.spaces:
+            x, y = self.get_space_coordinates(10, 10, board_size, space.position)
+            self.tile_rects.append(pygame.Rect(x, y, 60, 60))
+            self.tile_states.append(self.get_tile_state(space))
+            self.draw_space(layer, space, x, y)
+    
+    def split_layer(self):
+        # Only the margin and the rounded corners need blending; the rest of
+        # the board is opaque and blits as a plain copy in the display format
+        layer = self.board_layer
+        self.board_face = layer.convert()
+        size, edge = self.board_layer_size + 20, LAYER_EDGE
+        middle = size - 2 * edge
+        self.layer_parts = [(self.board_face, pygame.Rect(10, edge, self.board_layer_size, middle))]
+        self.layer_parts += [(layer, pygame.Rect(area)) for area in
+                             ((0, 0, size, edge), (0, size - edge, size, edge),
+                              (0, edge, 10, middle), (size - 10, edge, 10, middle))]
+    
+    def redraw_tile(self, position):
+        # Tiles overlap their neighbours, so repaint everything touching this
+        # tile in board order, clipped to the tile, to get the same composite
+        layer = self.board_layer
+        rect = self.tile_rects[position]
+        layer.set_clip(rect)
+        layer.fill((255, 255, 255), rect)
+        for space in self.spaces:
+            tile = self.tile_rects[space.position]
+            if tile.colliderect(rect):
+                self.draw_space(layer, space, tile.x, tile.y)
+        layer.set_clip(None)
+        if self.board_face is not None:
+            self.board_face.blit(layer, rect, rect)
+    
+    def get_tile_state(self, space):
+        if space.kind == "corner":
+            return self.get_corner_image(space.position) is not None
+        property = space.property
+        if property is None:
+            return None
+        return (property.owner, property.houses, property.hotel, property.mortgaged)
+    
+    def draw_space(self, surface, space, x, y):
+        i = space.position
+        
+        # Draw space background
+        if space.color:
+            pygame.draw.rect(surface, space.color, (x, y, 60, 60))
+        
+        # Draw space border
+        pygame.draw.rect(surface, (0, 0, 0), (x, y, 60, 60), 1)
+        
+        # Draw space content
+        kind = space.kind
+        if kind == "corner":
+            self.draw_corner_space(surface, x, y, i)
+        elif kind == "railroad":
+            self.draw_railroad_space(surface, x, y, i)
+        elif kind == "utility":
+            self.draw_utility_space(surface, x, y, i)
+        elif kind == "tax":
+            self.draw_tax_space(surface, x, y, i)
+        elif kind == "chance":
+            self.draw_chance_space(surface, x, y)
+        elif kind == "community_chest":
+            self.draw_community_chest_space(surface, x, y)
+        elif kind == "property":
+            self.draw_property_space(surface, x, y, space.property)
+        
+        # Ownership strip and mortgage cross
+        property = space.property
+        if property and property.owner:
+            pygame.draw.rect(surface, property.owner.color, (x + 1, y + 54, 58, 5))
+        if property and property.mortgaged:
+            pygame.draw.line(surface, (90, 90, 90), (x + 4, y + 4), (x + 56, y + 56), 2)
+            pygame.draw.line(surface, (90, 90, 90), (x + 56, y + 4), (x + 4, y + 56), 2)
     
     def draw_corner_space(self, screen, x, y, position):
-        corner_names = ["go", "jail", "free_parking", "go_to_jail"]
         if position in self.corner_spaces:
-            idx = self.corner_spaces.index(position)
-            if corner_names[idx] in self.corner_images:
-                screen.blit(self.corner_images[corner_names[idx]], (x, y))
+            image = self.get_corner_image(position)
+            if image:
+                screen.blit(image, (x, y))
             else:
-                font = pygame.font.Font(None, 20)
-                text = font.render(corner_names[idx].replace('_', ' ').title(), True, (0, 0, 0))
+                font = fonts.get_font(None, 20)
+                text = fonts.render_text(font, self.spaces[position].label, (0, 0, 0))
                 text_rect = text.get_rect(center=(x + 30, y + 30))
                 screen.blit(text, text_rect)
     
     def draw_railroad_space(self, screen, x, y, position):
         railroad = self.get_property_at_position(position)
         if railroad:
-            font = pygame.font.Font(None, 16)
-            text = font.render(railroad.name, True, (0, 0, 0))
+            font = fonts.get_font(None, 16)
+            text = fonts.render_text(font, railroad.name, (0, 0, 0))
             text_rect = text.get_rect(center=(x + 30, y + 30))
             screen.blit(text, text_rect)
     
     def draw_utility_space(self, screen, x, y, position):
         utility = self.get_property_at_position(position)
         if utility:
-            font = pygame.font.Font(None, 16)
-            text = font.render(utility.name, True, (0, 0, 0))
+            font = fonts.get_font(None, 16)
+            text = fonts.render_text(font, utility.name, (0, 0, 0))
             text_rect = text.get_rect(center=(x + 30, y + 30))
             screen.blit(text, text_rect)
     
     def draw_tax_space(self, screen, x, y, position):
-        font = pygame.font.Font(None, 16)
-        text = font.render("Tax", True, (0, 0, 0))
+        font = fonts.get_font(None, 16)
+        text = fonts.render_text(font, "Tax", (0, 0, 0))
         text_rect = text.get_rect(center=(x + 30, y + 30))
         screen.blit(text, text_rect)
     
     def draw_chance_space(self, screen, x, y):
-        font = pygame.font.Font(None, 16)
-        text = font.render("Chance", True, (0, 0, 0))
+        font = fonts.get_font(None, 16)
+        text = fonts.render_text(font, "Chance", (0, 0, 0))
         text_rect = text.get_rect(center=(x + 30, y + 30))
         screen.blit(text, text_rect)
     
     def draw_community_chest_space(self, screen, x, y):
-        font = pygame.font.Font(None, 16)
-        text = font.render("Community Chest", True, (0, 0, 0))
+        font = fonts.get_font(None, 16)
+        text = fonts.render_text(font, "Community Chest", (0, 0, 0))
         text_rect = text.get_rect(center=(x + 30, y + 30))
         screen.blit(text, text_rect)
     
     def draw_property_space(self, screen, x, y, property):
         # Draw property name
-        font = pygame.font.Font(None, 16)
-        text = font.render(property.name, True, (0, 0, 0))
+        font = fonts.get_font(None, 16)
+        text = fonts.render_text(font, property.name, (0, 0, 0))
         text_rect = text.get_rect(center=(x + 30, y + 15))
         screen.blit(text, text_rect)
         
         # Draw price
-        price_text = font.render(f"${property.price}", True, (0, 0, 0))
+        price_text = fonts.render_text(font, f"${property.price}", (0, 0, 0))
         price_rect = price_text.get_rect(center=(x + 30, y + 45))
         screen.blit(price_text, price_rect)
         
@@ -245,7 +388,10 @@ class Board:
         return x, y
     
     def get_property_at_position(self, position):
-        for property in self.properties:
-            if property.position == position:
-                return property
-        return None 
\ No newline at end of file
+        return self.property_by_position[position % 40]
+    
+    def get_property_by_name(self, name):
+        return self.property_by_name.get(name)
+    
+    def get_color_group(self, color):
+        return self.color_groups.get(color, []) 
\ No newline at end of file
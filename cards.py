@@ -1,19 +1,44 @@
 import random
-import pygame
+import struct
+from array import array
+from lazy import lazy_import
+
+# Rendering modules load on first draw; the rules engine never needs them
+pygame = lazy_import("pygame")
+fonts = lazy_import("fonts")
+assets = lazy_import("assets")
+
+# Card effects are data: an opcode plus integer arguments, run by
+# GameEngine.execute_card and, over arrays of games, by batch_sim. Decks hold
+# no code, so they pickle to worker processes and can be analysed.
+NOOP = 0
+MOVE_TO = 1  # (position): advance, collecting GO salary if passing it
+MOVE_REL = 2  # (spaces)
+NEAREST_UTILITY = 3
+NEAREST_RAILROAD = 4
+CASH = 5  # (amount): negative amounts are only paid if affordable
+JAIL = 6
+JAIL_CARD = 7
+REPAIRS = 8  # (per house, per hotel): charged in full, so it can bankrupt
+PAY_EACH = 9  # (amount): paid to every other player still in the game
+MAX_ARGS = 2
 
 class Card:
-    def __init__(self, text, action):
+    def __init__(self, text, op, *args):
         self.text = text
-        self.action = action
-        self.image = None
-        self.load_image()
+        self.op = op
+        self.args = args
     
-    def load_image(self):
-        try:
-            self.image = pygame.image.load(f"assets/images/cards/{self.text.lower().replace(' ', '_')}.png")
-            self.image = pygame.transform.scale(self.image, (200, 120))
-        except:
-            self.image = None
+    @property
+    def effect(self):
+        # (op, arg, ...) padded to a fixed width, for tables and hashing
+        return (self.op, *self.args, *(0,) * (MAX_ARGS - len(self.args)))
+    
+    @property
+    def image(self):
+        # Looked up on first draw through the shared asset cache, so building
+        # a deck never touches the disk
+        return assets.get_image(assets.image_path("cards", f"{assets.slug(self.text)}.png"), (200, 120))
     
     def draw(self, screen, x, y):
         if self.image:
@@ -24,65 +49,108 @@ class Card:
             pygame.draw.rect(screen, (0, 0, 0), (x, y, 200, 120), 2)
             
             # Draw card text
-            font = pygame.font.Font(None, 20)
+            font = fonts.get_font(None, 20)
             words = self.text.split()
             for i, word in enumerate(words):
-                text = font.render(word, True, (0, 0, 0))
+                text = fonts.render_text(font, word, (0, 0, 0))
                 text_rect = text.get_rect(center=(x + 100, y + 30 + i*20))
                 screen.blit(text, text_rect)
 
 class CardDeck:
-    def __init__(self, cards):
+    # The cards never move: the deck is a permutation of their indices and a
+    # cursor, reshuffled in place once every card has been drawn. Each
+    # reshuffle is seeded from the deck's own seed and shuffle count, so the
+    # order never depends on how many dice the game has rolled, and the
+    # whole deck snapshots to a few dozen bytes.
+    SNAPSHOT = struct.Struct("<QIB")  # seed, shuffles, cursor; then order and holders
+    FREE = 255  # Holder of a card in circulation
+    
+    def __init__(self, cards, rng=None):
         self.cards = cards
+        self.seed = (rng or random).getrandbits(64)
+        self.order = array("B", range(len(cards)))
+        self.holders = array("B", [self.FREE] * len(cards))  # Player index holding a card out of the deck
+        self.shuffles = 0
+        self.cursor = 0
         self.shuffle()
     
     def shuffle(self):
-        random.shuffle(self.cards)
+        if self.FREE not in self.holders:
+            raise IndexError("every card is held")
+        random.Random(self.seed + self.shuffles).shuffle(self.order)
+        self.shuffles += 1
+        self.cursor = 0
     
     def draw_card(self):
-        if not self.cards:
-            self.shuffle()
-        return self.cards.pop()
+        # Cards held by players are skipped until they are released
+        while True:
+            if self.cursor == len(self.order):
+                self.shuffle()
+            index = self.order[self.cursor]
+            self.cursor += 1
+            if self.holders[index] == self.FREE:
+                return self.cards[index]
+    
+    def hold(self, card, holder):
+        self.holders[self.cards.index(card)] = holder
+    
+    def release(self, holder):
+        # Puts one card held by holder back into circulation
+        for index, current in enumerate(self.holders):
+            if current == holder:
+                self.holders[index] = self.FREE
+                return True
+        return False
+    
+    def snapshot(self):
+        return self.SNAPSHOT.pack(self.seed, self.shuffles, self.cursor) + self.order.tobytes() + self.holders.tobytes()
+    
+    def restore(self, data):
+        count = len(self.cards)
+        self.seed, self.shuffles, self.cursor = self.SNAPSHOT.unpack_from(data, 0)
+        start = self.SNAPSHOT.size
+        self.order = array("B", data[start:start + count])
+        self.holders = array("B", data[start + count:start + 2 * count])
     
-    def add_card(self, card):
-        self.cards.append(card)
+    def snapshot_size(self):
+        return self.SNAPSHOT.size + 2 * len(self.cards)
 
 def create_chance_cards():
     return [
-        Card("Advance to Go", lambda player: player.move_to(0)),
-        Card("Advance to Illinois Avenue", lambda player: player.move_to(24)),
-        Card("Advance to St. Charles Place", lambda player: player.move_to(11)),
-        Card("Advance to nearest Utility", lambda player: player.move_to_nearest_utility()),
-        Card("Advance to nearest Railroad", lambda player: player.move_to_nearest_railroad()),
-        Card("Bank pays you dividend of $50", lambda player: player.receive_money(50)),
-        Card("Get Out of Jail Free", lambda player: player.add_jail_card()),
-        Card("Go Back 3 Spaces", lambda player: player.move(-3)),
-        Card("Go to Jail", lambda player: player.go_to_jail()),
-        Card("Make general repairs on all your property", lambda player: player.pay_repairs()),
-        Card("Pay poor tax of $15", lambda player: player.pay_money(15)),
-        Card("Take a trip to Reading Railroad", lambda player: player.move_to(5)),
-        Card("Take a walk on the Boardwalk", lambda player: player.move_to(39)),
-        Card("You have been elected Chairman of the Board", lambda player: player.pay_each_player(50)),
-        Card("Your building loan matures", lambda player: player.receive_money(150)),
-        Card("You have won a crossword competition", lambda player: player.receive_money(100))
+        Card("Advance to Go", MOVE_TO, 0),
+        Card("Advance to Illinois Avenue", MOVE_TO, 24),
+        Card("Advance to St. Charles Place", MOVE_TO, 11),
+        Card("Advance to nearest Utility", NEAREST_UTILITY),
+        Card("Advance to nearest Railroad", NEAREST_RAILROAD),
+        Card("Bank pays you dividend of $50", CASH, 50),
+        Card("Get Out of Jail Free", JAIL_CARD),
+        Card("Go Back 3 Spaces", MOVE_REL, -3),
+        Card("Go to Jail", JAIL),
+        Card("Make general repairs on all your property", REPAIRS, 25, 100),
+        Card("Pay poor tax of $15", CASH, -15),
+        Card("Take a trip to Reading Railroad", MOVE_TO, 5),
+        Card("Take a walk on the Boardwalk", MOVE_TO, 39),
+        Card("You have been elected Chairman of the Board", PAY_EACH, 50),
+        Card("Your building loan matures", CASH, 150),
+        Card("You have won a crossword competition", CASH, 100)
     ]
 
 def create_community_chest_cards():
     return [
-        Card("Advance to Go", lambda player: player.move_to(0)),
-        Card("Bank error in your favor", lambda player: player.receive_money(200)),
-        Card("Doctor's fee", lambda player: player.pay_money(50)),
-        Card("From sale of stock you get $45", lambda player: player.receive_money(45)),
-        Card("Get Out of Jail Free", lambda player: player.add_jail_card()),
-        Card("Go to Jail", lambda player: player.go_to_jail()),
-        Card("Grand Opera Night", lambda player: player.receive_money(50)),
-        Card("Holiday Fund matures", lambda player: player.receive_money(100)),
-        Card("Income tax refund", lambda player: player.receive_money(20)),
-        Card("Life insurance matures", lambda player: player.receive_money(100)),
-        Card("Pay hospital fees of $100", lambda player: player.pay_money(100)),
-        Card("Pay school fees of $50", lambda player: player.pay_money(50)),
-        Card("Receive $25 consultancy fee", lambda player: player.receive_money(25)),
-        Card("You are assessed for street repairs", lambda player: player.pay_repairs()),
-        Card("You have won second prize in a beauty contest", lambda player: player.receive_money(10)),
-        Card("You inherit $100", lambda player: player.receive_money(100))
+        Card("Advance to Go", MOVE_TO, 0),
+        Card("Bank error in your favor", CASH, 200),
+        Card("Doctor's fee", CASH, -50),
+        Card("From sale of stock you get $45", CASH, 45),
+        Card("Get Out of Jail Free", JAIL_CARD),
+        Card("Go to Jail", JAIL),
+        Card("Grand Opera Night", CASH, 50),
+        Card("Holiday Fund matures", CASH, 100),
+        Card("Income tax refund", CASH, 20),
+        Card("Life insurance matures", CASH, 100),
+        Card("Pay hospital fees of $100", CASH, -100),
+        Card("Pay school fees of $50", CASH, -50),
+        Card("Receive $25 consultancy fee", CASH, 25),
+        Card("You are assessed for street repairs", REPAIRS, 25, 100),
+        Card("You have won second prize in a beauty contest", CASH, 10),
+        Card("You inherit $100", CASH, 100)
     ] 
\ No newline at end of file
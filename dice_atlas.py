@@ -0,0 +1,82 @@
+import math
+import pygame
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+DOT_SIZE = 8
+CORNER_RADIUS = 10
+
+# Every face and its shadow at every rotation the roll animation passes through
+_faces = {}  # (size, value, rotation) -> rotated face
+_shadows = {}  # (size, rotation) -> rotated shadow
+_built = set()  # (size, rotation_step) already generated
+
+
+def dot_positions(size):
+    low, mid, high = size // 3, size // 2, 2 * size // 3
+    return {
+        1: [(mid, mid)],
+        2: [(low, low), (high, high)],
+        3: [(low, low), (mid, mid), (high, high)],
+        4: [(low, low), (high, low), (low, high), (high, high)],
+        5: [(low, low), (high, low), (mid, mid), (low, high), (high, high)],
+        6: [(low, low), (low, mid), (low, high), (high, low), (high, mid), (high, high)],
+    }
+
+
+def render_face(size, value):
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(surface, WHITE, (0, 0, size, size), border_radius=CORNER_RADIUS)
+    pygame.draw.rect(surface, BLACK, (0, 0, size, size), 2, border_radius=CORNER_RADIUS)
+    for pos in dot_positions(size)[value]:
+        pygame.draw.circle(surface, BLACK, pos, DOT_SIZE)
+    return surface
+
+
+def render_shadow(size):
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(surface, (0, 0, 0, 100), (0, 0, size, size))
+    return surface
+
+
+def get_face(size, value, rotation):
+    rotation %= 360
+    key = (size, value, rotation)
+    face = _faces.get(key)
+    if face is None:
+        face = render_face(size, value)
+        if rotation:
+            face = pygame.transform.rotate(face, rotation)
+        _faces[key] = face
+    return face
+
+
+def get_shadow(size, rotation):
+    rotation %= 360
+    key = (size, rotation)
+    shadow = _shadows.get(key)
+    if shadow is None:
+        shadow = render_shadow(size)
+        if rotation:
+            shadow = pygame.transform.rotate(shadow, rotation)
+        _shadows[key] = shadow
+    return shadow
+
+
+def build(size, rotation_step):
+    # Generate the whole atlas up front so no frame of a roll pays for a rotation
+    if (size, rotation_step) in _built:
+        return
+    steps = 360 // math.gcd(rotation_step, 360)
+    for i in range(steps):
+        rotation = i * rotation_step
+        get_shadow(size, rotation)
+        for value in range(1, 7):
+            get_face(size, value, rotation)
+    _built.add((size, rotation_step))
+
+
+def clear():
+    _faces.clear()
+    _shadows.clear()
+    _built.clear()
@@ -0,0 +1,77 @@
+import os
+import pygame
+
+
+class DirtyRectRenderer:
+    # Collects the screen rectangles that changed this frame and presents only
+    # those with display.update(), falling back to a full flip when too much
+    # of the window changed or the frame was invalidated.
+    def __init__(self, screen, enabled=None, full_threshold=0.5):
+        if enabled is None:
+            enabled = os.environ.get("MONOPOLY_DIRTY_RECTS", "0") not in ("", "0")
+        self.screen = screen
+        self.enabled = enabled
+        self.full_threshold = full_threshold
+        self.full = True
+        self.rects = []  # Transient rects drawn this frame
+        self.previous_rects = []  # ...and last frame, so they get erased
+        self.tracked = {}  # key -> (rect, state) as last presented
+        self.seen = {}
+        self.frames = 0
+        self.full_frames = 0
+        self.pixels_pushed = 0
+
+    def invalidate(self):
+        self.full = True
+
+    def add(self, rect):
+        if rect:
+            self.rects.append(pygame.Rect(rect))
+
+    def add_many(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def track(self, key, rect, state=None):
+        # Persistent item: reported only when its rect or state changes
+        rect = pygame.Rect(rect) if rect else None
+        self.seen[key] = (rect, state)
+        previous = self.tracked.get(key)
+        if previous != (rect, state):
+            if previous and previous[0]:
+                self.rects.append(previous[0])
+            if rect:
+                self.rects.append(rect)
+
+    def present(self):
+        self.frames += 1
+        # Items that were drawn last frame but not this one leave a hole to repaint
+        for key, (rect, state) in self.tracked.items():
+            if key not in self.seen and rect:
+                self.rects.append(rect)
+
+        screen_rect = self.screen.get_rect()
+        rects = [r.clip(screen_rect) for r in self.previous_rects + self.rects]
+        rects = [r for r in rects if r.width and r.height]
+        area = sum(r.width * r.height for r in rects)
+
+        if not self.enabled or self.full or area > self.full_threshold * screen_rect.width * screen_rect.height:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.pixels_pushed += screen_rect.width * screen_rect.height
+        elif rects:
+            pygame.display.update(rects)
+            self.pixels_pushed += area
+
+        self.previous_rects = self.rects
+        self.rects = []
+        self.tracked = self.seen
+        self.seen = {}
+        self.full = False
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "full_frames": self.full_frames,
+            "pixels_pushed": self.pixels_pushed,
+        }
@@ -0,0 +1,311 @@
+import random
+from board import Board
+from player import Player
+from cards import (CardDeck, create_chance_cards, create_community_chest_cards, MOVE_TO, MOVE_REL,
+                   NEAREST_UTILITY, NEAREST_RAILROAD, CASH, JAIL, JAIL_CARD, REPAIRS, PAY_EACH)
+
+# Rules constants
+STARTING_MONEY = 500
+BOARD_SPACES = 40
+GO_SALARY = 200
+JAIL_POSITION = 10
+GO_TO_JAIL_POSITION = 30
+JAIL_FINE = 50
+MAX_DOUBLES = 3
+TAXES = {4: 200, 38: 100}  # Income Tax, Luxury Tax
+PLAYER_COLORS = [(255, 0, 0), (0, 0, 255), (0, 255, 0),
+                 (255, 255, 0), (255, 165, 0), (128, 0, 128)]
+
+
+def always_buy(player, property):
+    return player.money >= property.price
+
+
+class TurnResult:
+    def __init__(self, player, dice):
+        self.player = player
+        self.dice = dice
+        self.start = player.position
+        self.end = player.position
+        self.passed_go = False
+        self.card = None
+        self.card_kind = None
+        self.rent = 0
+        self.rent_to = None
+        self.tax = 0
+        self.purchased = None
+        self.pending_purchase = None
+        self.jailed = False
+        self.left_jail = False
+        self.bankrupt = False
+        self.extra_turn = False
+
+    @property
+    def doubles(self):
+        return self.dice is not None and self.dice[0] == self.dice[1]
+
+
+class GameEngine:
+    # Pure rules model: owns players, board ownership, decks and turn order.
+    # Nothing here renders or waits, so a whole turn resolves in one call.
+    def __init__(self, num_players=2, players=None, board=None, seed=None,
+                 starting_money=STARTING_MONEY, buy_policy=always_buy):
+        self.board = board if board is not None else Board(load_images=False)
+        self.num_players = len(players) if players else num_players
+        self.starting_money = starting_money
+        # Cards are built once and re-dealt on every reset
+        self.chance_cards = create_chance_cards()
+        self.community_chest_cards = create_community_chest_cards()
+        # Where the "nearest" cards lead from every space
+        self.nearest = {NEAREST_UTILITY: self.nearest_of(self.board.utilities),
+                        NEAREST_RAILROAD: self.nearest_of(self.board.railroads)}
+        # buy_policy(player, property) -> bool; None leaves the decision to the caller
+        self.buy_policy = buy_policy
+        self.log = None  # turnlog.TurnLog recording this game, if any
+        self.reset(seed, players)
+
+    @staticmethod
+    def nearest_of(targets):
+        return [min(targets, key=lambda t: (t - position) % BOARD_SPACES) for position in range(BOARD_SPACES)]
+
+    def reset(self, seed=None, players=None):
+        # Start a fresh game on the same engine; a given seed always replays the same game
+        self.rng = random.Random(seed)
+        if players is None:
+            players = [Player(f"Player {i+1}", PLAYER_COLORS[i % len(PLAYER_COLORS)], self.starting_money)
+                       for i in range(self.num_players)]
+        self.players = players
+        for property in self.board.properties:
+            property.owner = None
+            property.houses = 0
+            property.hotel = False
+            property.mortgaged = False
+        self.chance_deck = CardDeck(self.chance_cards, rng=self.rng)
+        self.community_chest_deck = CardDeck(self.community_chest_cards, rng=self.rng)
+        self.current_player = 0
+        self.doubles_rolled = 0
+        self.turn = 0
+        self.pending_purchase = None
+
+    def roll_dice(self):
+        return (self.rng.randint(1, 6), self.rng.randint(1, 6))
+
+    def active_players(self):
+        return [p for p in self.players if not p.bankrupt]
+
+    def is_over(self):
+        return len(self.active_players()) <= 1
+
+    def winner(self):
+        active = self.active_players()
+        if len(active) == 1:
+            return active[0]
+        return None
+
+    def play_turn(self, dice=None):
+        player = self.players[self.current_player]
+        if dice is None:
+            dice = self.roll_dice()
+        result = TurnResult(player, dice)
+        self.pending_purchase = None
+
+        if player.jail_turns > 0:
+            self.resolve_jail_turn(player, result)
+        else:
+            if result.doubles:
+                self.doubles_rolled += 1
+            if self.doubles_rolled >= MAX_DOUBLES:
+                self.send_to_jail(player, result)
+            else:
+                self.move_player(player, sum(dice), result)
+                self.resolve_space(player, sum(dice), result)
+                result.extra_turn = result.doubles and not result.jailed
+
+        self.check_bankruptcy(player, result)
+        result.end = player.position
+        self.turn += 1
+        if not result.extra_turn or player.bankrupt:
+            self.next_player()
+        if self.log is not None:
+            self.log.turn(self, result)
+        return result
+
+    def play_game(self, max_turns=1000):
+        while not self.is_over() and self.turn < max_turns:
+            self.play_turn()
+        return self.winner()
+
+    def resolve_jail_turn(self, player, result):
+        if player.jail_cards > 0:
+            player.jail_cards -= 1
+            self.return_jail_card(player)
+            player.jail_turns = 0
+        elif result.doubles:
+            player.jail_turns = 0
+        else:
+            player.jail_turns -= 1
+            if player.jail_turns > 0:
+                return
+            player.money -= JAIL_FINE  # Forced to pay on the last turn
+        result.left_jail = True
+        self.move_player(player, sum(result.dice), result)
+        self.resolve_space(player, sum(result.dice), result)
+
+    def move_player(self, player, spaces, result=None):
+        start = player.position
+        player.position = (start + spaces) % BOARD_SPACES
+        passed = spaces > 0 and player.position < start
+        if passed:
+            player.money += GO_SALARY
+            if result:
+                result.passed_go = True
+        return passed
+
+    def send_to_jail(self, player, result=None):
+        player.position = JAIL_POSITION
+        player.jail_turns = 3
+        self.doubles_rolled = 0
+        if result:
+            result.jailed = True
+
+    def resolve_space(self, player, dice_total, result, allow_card=True):
+        position = player.position
+        space = self.board.spaces[position]
+        if position == GO_TO_JAIL_POSITION:
+            self.send_to_jail(player, result)
+        elif position in TAXES:
+            player.money -= TAXES[position]
+            result.tax += TAXES[position]
+        elif space.kind == "chance" or space.kind == "community_chest":
+            if allow_card:
+                self.apply_card(player, space.kind, dice_total, result)
+        elif space.property:
+            self.resolve_property(player, space.property, dice_total, result)
+
+    def resolve_property(self, player, property, dice_total, result):
+        if property.owner is None:
+            if self.buy_policy is None:
+                self.pending_purchase = (player, property)
+                result.pending_purchase = property
+            elif self.buy_policy(player, property) and player.buy_property(property):
+                result.purchased = property
+        elif property.owner is not player:
+            rent = property.get_rent(dice_total)
+            player.money -= rent
+            property.owner.money += rent
+            result.rent += rent
+            result.rent_to = property.owner
+
+    def apply_card(self, player, kind, dice_total, result):
+        deck = self.chance_deck if kind == "chance" else self.community_chest_deck
+        card = deck.draw_card()
+        result.card = card
+        result.card_kind = kind
+        start = player.position
+        self.execute_card(player, card, result, deck)
+        if card.op != JAIL and player.position != start:
+            # Cards never chain into another card draw
+            self.resolve_space(player, dice_total, result, allow_card=False)
+
+    def execute_card(self, player, card, result, deck):
+        # Interpreter for the card opcodes in cards.py
+        op, args = card.op, card.args
+        if op == MOVE_TO:
+            self.advance_to(player, args[0], result)
+        elif op == NEAREST_UTILITY or op == NEAREST_RAILROAD:
+            self.advance_to(player, self.nearest[op][player.position], result)
+        elif op == MOVE_REL:
+            self.move_player(player, args[0], result)
+        elif op == CASH:
+            if args[0] >= 0 or player.money >= -args[0]:
+                player.money += args[0]
+        elif op == REPAIRS:
+            house, hotel = args
+            # Charged in full, like rent and tax; the player may go broke
+            player.money -= sum(p.houses * house + p.hotel * hotel for p in player.properties)
+        elif op == PAY_EACH:
+            for other in self.players:
+                if other is not player and not other.bankrupt:
+                    other.money += args[0]
+                    player.money -= args[0]
+        elif op == JAIL:
+            self.send_to_jail(player, result)
+        elif op == JAIL_CARD:
+            # Kept by the player, out of the deck, until used
+            player.jail_cards += 1
+            deck.hold(card, self.players.index(player))
+
+    def return_jail_card(self, player):
+        index = self.players.index(player)
+        return self.chance_deck.release(index) or self.community_chest_deck.release(index)
+
+    def advance_to(self, player, position, result=None):
+        # Cards only move forward, so landing behind the start means passing GO
+        start = player.position
+        player.position = position
+        if position < start:
+            player.money += GO_SALARY
+            if result:
+                result.passed_go = True
+
+    # Decisions made outside play_turn (the buy/sell dialog, minigames, ending
+    # a turn early) are logged as commands so a replay can re-apply them
+    def buy_property(self, player, property):
+        if property.owner is not None or not player.buy_property(property):
+            return False
+        if self.log is not None:
+            self.log.buy(player, property)
+        return True
+
+    def sell_property(self, player, property):
+        if property.owner is not player:
+            return False
+        player.remove_property(property)
+        player.money += property.price // 2  # Sell for half price
+        if self.log is not None:
+            self.log.sell(player, property)
+        return True
+
+    def apply_minigame(self, player, kind, value):
+        # value: the dice_roll reward, the property won at property_auction,
+        # unused for jail_escape
+        if kind == "dice_roll":
+            player.receive_money(value)
+        elif kind == "property_auction":
+            if value.owner is None:
+                player.buy_property(value)
+        elif kind == "jail_escape":
+            if player.use_jail_card():
+                self.return_jail_card(player)
+        if self.log is not None:
+            self.log.minigame(player, kind, value)
+
+    def end_turn(self):
+        self.next_player()
+        if self.log is not None:
+            self.log.end_turn()
+
+    def check_bankruptcy(self, player, result):
+        if player.money >= 0:
+            return
+        # Return everything to the bank and drop out of the rotation
+        while self.return_jail_card(player):
+            player.jail_cards -= 1
+        for property in list(player.properties):
+            property.houses = 0
+            property.hotel = False
+            property.mortgaged = False
+            player.remove_property(property)
+        player.bankrupt = True
+        result.bankrupt = True
+
+    def next_player(self):
+        self.doubles_rolled = 0
+        if self.is_over():
+            return
+        count = len(self.players)
+        for step in range(1, count + 1):
+            index = (self.current_player + step) % count
+            if not self.players[index].bankrupt:
+                self.current_player = index
+                return
@@ -0,0 +1,80 @@
+import pygame
+from collections import OrderedDict
+
+# Named fonts used across the UI: (file, size, fallback bold, fallback italic)
+FONT_SPECS = {
+    "bold": ("assets/fonts/PlayfairDisplaySemibold.ttf", 36, True, False),
+    "regular": ("assets/fonts/PlayfairDisplay-VariableFont_wght.ttf", 24, False, False),
+    "italic": ("assets/fonts/PlayfairDisplay-Italic-VariableFont_wght.ttf", 24, False, True),
+    "title": ("assets/fonts/PlayfairDisplaySemibold.ttf", 72, True, False),
+    "menu": ("assets/fonts/PlayfairDisplay-VariableFont_wght.ttf", 36, False, False),
+}
+
+_fonts = {}
+
+
+def get_font(path, size, bold=False, italic=False):
+    # Every font is constructed once per (path, size); path None is pygame's default font
+    key = (path, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(path, size)
+        except FileNotFoundError as e:
+            print(f"Error loading fonts: {e}")
+            print("Using system fonts as fallback")
+            font = pygame.font.SysFont("arial", size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+def get_named_font(name):
+    path, size, bold, italic = FONT_SPECS[name]
+    return get_font(path, size, bold, italic)
+
+
+class TextCache:
+    # Bounded LRU of rendered text surfaces keyed by (font, text, colour, antialias)
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self.surfaces),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    # Cached surfaces are shared: blit them, never draw on them
+    return text_cache.render(font, text, color, antialias)
@@ -1,9 +1,6 @@
 import pygame
 import os
 
-# Initialize Pygame
-pygame.init()
-
 # Create dice images
 def create_dice_image(value, size=60):
     surface = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -27,12 +24,25 @@ def create_dice_image(value, size=60):
     
     return surface
 
-# Create dice images directory if it doesn't exist
-os.makedirs("assets/images/dice", exist_ok=True)
+def main():
+    # pygame is only initialized when the script runs, not when it is imported
+    pygame.init()
+    
+    # Create dice images directory if it doesn't exist
+    os.makedirs("assets/images/dice", exist_ok=True)
+
+    # Generate dice images
+    for i in range(1, 7):
+        dice_surface = create_dice_image(i)
+        pygame.image.save(dice_surface, f"assets/images/dice{i}.png")
+
+    # Pack every image the game draws, pre-scaled, into one atlas with an index
+    from atlas import build_atlas
+    atlas = build_atlas()
+    print(f"Packed {len(atlas['entries'])} images into a {atlas['width']}x{atlas['height']} atlas")
+
+    pygame.quit() 
 
-# Generate dice images
-for i in range(1, 7):
-    dice_surface = create_dice_image(i)
-    pygame.image.save(dice_surface, f"assets/images/dice{i}.png")
 
-pygame.quit() 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
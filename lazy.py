@@ -0,0 +1,19 @@
+import importlib
+
+
+class LazyModule:
+    # Module stand-in that imports the real module on first attribute access,
+    # so rules code can be imported without pygame or the renderer
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    return LazyModule(name)
@@ -1,16 +1,22 @@
 import pygame
 import sys
+import time
 import random
 import math
 from board import Board
 from player import Player
-from properties import Property
-from cards import CardDeck, create_chance_cards, create_community_chest_cards
+from engine import GameEngine
 from minigames import DiceRollGame, PropertyAuction, JailEscape
-
-# Initialize Pygame
-pygame.init()
-pygame.font.init()
+from fonts import get_named_font, render_text
+from backgrounds import get_vertical_gradient, get_overlay
+from dirty_rects import DirtyRectRenderer
+from particles import ParticleSystem
+import tokens
+import dice_atlas
+from telemetry import FrameTelemetry
+from profiler import Profiler
+from savegame import Autosaver, SaveError, load_game
+from turnlog import TurnLog, LOG_PATH, rotate_log
 
 # Constants
 WINDOW_WIDTH = 1200
@@ -18,6 +24,9 @@ WINDOW_HEIGHT = 800
 BOARD_SIZE = 800
 BUTTON_HEIGHT = 40
 FPS = 60
+TICK_RATE = 60  # Fixed simulation steps per second, independent of FPS
+TICK = 1.0 / TICK_RATE
+MAX_FRAME_TIME = 0.25  # Longer stalls are not caught up, the game just pauses
 
 # Colors
 WHITE = (255, 255, 255)
@@ -43,60 +52,16 @@ BUTTON_BG = (255, 255, 255, 200)  # More opaque white for buttons
 BOARD_SHADOW = (0, 0, 0, 30)  # Subtle shadow for board
 BUTTON_SHADOW = (0, 0, 0, 40)  # Slightly stronger shadow for buttons
 
-# Set up the display
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption("Monopoly Game")
-
-# Load fonts
-try:
-    FONT_BOLD = pygame.font.Font("assets/fonts/PlayfairDisplaySemibold.ttf", 36)
-    FONT_REGULAR = pygame.font.Font("assets/fonts/PlayfairDisplay-VariableFont_wght.ttf", 24)
-    FONT_ITALIC = pygame.font.Font("assets/fonts/PlayfairDisplay-Italic-VariableFont_wght.ttf", 24)
-except FileNotFoundError as e:
-    print(f"Error loading fonts: {e}")
-    print("Using system fonts as fallback")
-    FONT_BOLD = pygame.font.SysFont("arial", 36, bold=True)
-    FONT_REGULAR = pygame.font.SysFont("arial", 24)
-    FONT_ITALIC = pygame.font.SysFont("arial", 24, italic=True)
-
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(2, 5)
-        self.speed_x = random.uniform(-2, 2)
-        self.speed_y = random.uniform(-2, 2)
-        self.lifetime = 30
-        self.alpha = 255
-        
-    def update(self):
-        self.x += self.speed_x
-        self.y += self.speed_y
-        self.lifetime -= 1
-        self.alpha = int((self.lifetime / 30) * 255)
-        
-    def draw(self, screen):
-        surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surface, (*self.color, self.alpha), (self.size, self.size), self.size)
-        screen.blit(surface, (self.x - self.size, self.y - self.size))
-
-class ParticleSystem:
-    def __init__(self):
-        self.particles = []
-        
-    def add_particles(self, x, y, color, count=10):
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
-            
-    def update(self):
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for particle in self.particles:
-            particle.update()
-            
-    def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+def init_display():
+    # pygame and the window are set up here, on first use, never at import;
+    # fonts come from the registry when first drawn
+    if not pygame.get_init():
+        pygame.init()
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (WINDOW_WIDTH, WINDOW_HEIGHT):
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption("Monopoly")
+    return screen
 
 class Dice:
     def __init__(self):
@@ -117,6 +82,8 @@ class Dice:
         self.current_pos = self.final_pos
         
     def roll(self):
+        # Every face at every rotation step is generated on the first roll
+        dice_atlas.build(self.size, self.rotation_speed)
         self.rolling = True
         self.roll_frames = 0
         self.rotation = 0
@@ -144,181 +111,38 @@ class Dice:
 
     def draw(self, screen):
         if not self.rolling and not self.animation_complete:
-            return
+            return None
+        drawn = None
             
         # Add screen darkening effect during roll
         if self.rolling:
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            screen.blit(overlay, (0, 0))
+            screen.blit(get_overlay(screen.get_size(), (0, 0, 0, 128)), (0, 0))
             
         # Draw two dice side by side
         for i, value in enumerate(self.values):
             x_offset = i * (self.size + 40) - (self.size + 40) // 2  # Center the pair of dice
             
-            # Draw shadow
-            shadow_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surface, (0, 0, 0, 100), (0, 0, self.size, self.size))
-            shadow = pygame.transform.rotate(shadow_surface, self.rotation)
-            screen.blit(shadow, (self.current_pos[0] + x_offset - shadow.get_width()//2 + self.shadow_offset,
+            # Shadow and face come pre-rotated from the atlas
+            shadow = dice_atlas.get_shadow(self.size, self.rotation)
+            rect = screen.blit(shadow, (self.current_pos[0] + x_offset - shadow.get_width()//2 + self.shadow_offset,
                                self.current_pos[1] - shadow.get_height()//2 + self.shadow_offset))
+            drawn = drawn.union(rect) if drawn else rect
             
-            # Draw dice with rounded corners
-            dice_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.rect(dice_surface, WHITE, (0, 0, self.size, self.size), border_radius=10)
-            pygame.draw.rect(dice_surface, BLACK, (0, 0, self.size, self.size), 2, border_radius=10)
-            
-            # Draw larger dots
-            dot_size = 8
-            dot_positions = {
-                1: [(self.size//2, self.size//2)],
-                2: [(self.size//3, self.size//3), (2*self.size//3, 2*self.size//3)],
-                3: [(self.size//3, self.size//3), (self.size//2, self.size//2), (2*self.size//3, 2*self.size//3)],
-                4: [(self.size//3, self.size//3), (2*self.size//3, self.size//3),
-                    (self.size//3, 2*self.size//3), (2*self.size//3, 2*self.size//3)],
-                5: [(self.size//3, self.size//3), (2*self.size//3, self.size//3),
-                    (self.size//2, self.size//2),
-                    (self.size//3, 2*self.size//3), (2*self.size//3, 2*self.size//3)],
-                6: [(self.size//3, self.size//3), (self.size//3, self.size//2), (self.size//3, 2*self.size//3),
-                    (2*self.size//3, self.size//3), (2*self.size//3, self.size//2), (2*self.size//3, 2*self.size//3)]
-            }
-            
-            for pos in dot_positions[value]:
-                pygame.draw.circle(dice_surface, BLACK, pos, dot_size)
-            
-            # Rotate and draw dice
-            rotated_dice = pygame.transform.rotate(dice_surface, self.rotation)
-            screen.blit(rotated_dice, (self.current_pos[0] + x_offset - rotated_dice.get_width()//2,
-                                     self.current_pos[1] - rotated_dice.get_height()//2))
+            rotated_dice = dice_atlas.get_face(self.size, value, self.rotation)
+            drawn = drawn.union(screen.blit(rotated_dice, (self.current_pos[0] + x_offset - rotated_dice.get_width()//2,
+                                     self.current_pos[1] - rotated_dice.get_height()//2)))
             
             # Draw total during animation
             if self.rolling:
-                total_text = FONT_BOLD.render(f"Rolling...", True, WHITE)
-                screen.blit(total_text, (WINDOW_WIDTH//2 - total_text.get_width()//2, 
-                                       WINDOW_HEIGHT//2 + self.size))
+                total_text = render_text(get_named_font("bold"), f"Rolling...", WHITE)
+                drawn = drawn.union(screen.blit(total_text, (WINDOW_WIDTH//2 - total_text.get_width()//2, 
+                                       WINDOW_HEIGHT//2 + self.size)))
             elif self.animation_complete:
                 total = sum(self.values)
-                total_text = FONT_BOLD.render(f"Total: {total}", True, BLACK)
-                screen.blit(total_text, (self.current_pos[0] - total_text.get_width()//2,
-                                       self.current_pos[1] + self.size))
-
-    def handle_game_events(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE and not self.rolling:
-                self.roll_dice()
-            elif event.key == pygame.K_ESCAPE:
-                self.game_state = "menu"
-            elif event.key == pygame.K_b and not self.rolling:  # Buy property
-                current_player = self.players[self.current_player]
-                property = self.board.get_property_at_position(current_player.position)
-                if property and isinstance(property, Property):
-                    if property.owner is None and current_player.money >= property.price:
-                        current_player.money -= property.price
-                        property.owner = current_player
-            elif event.key == pygame.K_s and not self.rolling:  # Sell property
-                current_player = self.players[self.current_player]
-                property = self.board.get_property_at_position(current_player.position)
-                if property and isinstance(property, Property):
-                    if property.owner == current_player:
-                        current_player.money += property.price // 2  # Sell for half price
-                        property.owner = None
-        
-        # Handle roll dice button click
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.roll_button.check_click(event.pos):
-                if not self.rolling:
-                    self.roll_dice()
-                return
-            
-            # Check property buttons
-            current_player = self.players[self.current_player]
-            property = self.board.get_property_at_position(current_player.position)
-            if property and isinstance(property, Property):
-                if property.owner is None and self.buy_button.check_click(event.pos):
-                    if current_player.money >= property.price:
-                        current_player.money -= property.price
-                        property.owner = current_player
-                elif property.owner == current_player and self.sell_button.check_click(event.pos):
-                    current_player.money += property.price // 2
-                    property.owner = None
-            
-        if self.current_minigame:
-            self.current_minigame.handle_event(event)
-
-    def update_dice_roll(self):
-        if not self.rolling:
-            return
-            
-        # Update dice animation
-        if self.dice.update():  # If dice animation is complete
-            self.rolling = False
-            current_player = self.players[self.current_player]
-            total_roll = sum(self.dice.values)
-            
-            # Move player
-            current_player.move(total_roll)
-            
-            # Add particle effects
-            for i, value in enumerate(self.dice.values):
-                x_offset = i * (self.dice.size + 40) - (self.dice.size + 40) // 2
-                self.particle_system.add_particles(
-                    self.dice.current_pos[0] + x_offset,
-                    self.dice.current_pos[1],
-                    current_player.color,
-                    count=value * 3
-                )
-            
-            # Check for special squares
-            landed_property = self.board.get_property_at_position(current_player.position)
-            if landed_property:
-                if isinstance(landed_property, Property):
-                    if landed_property.owner is None:  # Property is unowned
-                        self.show_property_options(landed_property)
-                    elif landed_property.owner != current_player:  # Pay rent
-                        rent = landed_property.get_rent()
-                        current_player.money -= rent
-                        landed_property.owner.money += rent
-                elif landed_property.type == "chance":
-                    self.draw_chance_card()
-                elif landed_property.type == "community_chest":
-                    self.draw_community_chest_card()
-            
-            # Check for doubles
-            if self.dice.values[0] == self.dice.values[1]:
-                pass  # Player gets another turn
-            else:
-                self.next_player()
-
-    def draw_chance_card(self):
-        card = self.chance_deck.draw_card()
-        self.show_card_animation("CHANCE", card)
-        card.apply_effect(self.players[self.current_player])
-
-    def draw_community_chest_card(self):
-        card = self.community_chest_deck.draw_card()
-        self.show_card_animation("COMMUNITY CHEST", card)
-        card.apply_effect(self.players[self.current_player])
-
-    def show_card_animation(self, card_type, card):
-        # Create card surface
-        card_width = 300
-        card_height = 200
-        card_surface = pygame.Surface((card_width, card_height))
-        card_surface.fill(GOLD if card_type == "CHANCE" else BLUE)
-        
-        # Add card text
-        title = FONT_BOLD.render(card_type, True, BLACK)
-        description = FONT_REGULAR.render(card.description, True, BLACK)
-        
-        # Center text on card
-        card_surface.blit(title, (card_width//2 - title.get_width()//2, 20))
-        card_surface.blit(description, (card_width//2 - description.get_width()//2, 100))
-        
-        # Show card animation
-        card_pos = (WINDOW_WIDTH//2 - card_width//2, WINDOW_HEIGHT//2 - card_height//2)
-        self.screen.blit(card_surface, card_pos)
-        pygame.display.flip()
-        pygame.time.wait(2000)  # Show card for 2 seconds
+                total_text = render_text(get_named_font("bold"), f"Total: {total}", BLACK)
+                drawn = drawn.union(screen.blit(total_text, (self.current_pos[0] - total_text.get_width()//2,
+                                       self.current_pos[1] + self.size)))
+        return drawn
 
 class Button:
     def __init__(self, text, x, y, width, height, color, hover_color):
@@ -327,7 +151,7 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.current_color = color
-        self.font = FONT_REGULAR
+        self.font = get_named_font("regular")
         self.clicked = False
         self.click_time = 0
         self.click_delay = 0.5  # Delay between clicks in seconds
@@ -345,9 +169,10 @@ class Button:
         pygame.draw.rect(screen, self.current_color, self.rect, 2)
         
         # Draw text
-        text_surface = self.font.render(self.text, True, BLACK)
+        text_surface = render_text(self.font, self.text, BLACK)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
+        return self.rect.union(shadow_rect)
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -367,38 +192,152 @@ class Button:
             self.clicked = False
         return self.rect.collidepoint(pos) and not self.clicked
 
+class CardReveal:
+    # Timed card display; stays up for `duration` ms of the main loop's clock
+    # or until a click or key press dismisses it
+    faces = {}  # (card type, text) -> rendered card face
+
+    def __init__(self, card_type, card, duration=2000):
+        self.surface = self.get_face(card_type, card.text)
+        self.pos = (WINDOW_WIDTH//2 - self.surface.get_width()//2, WINDOW_HEIGHT//2 - self.surface.get_height()//2)
+        self.duration = duration
+        self.start_time = 0
+        self.open = True
+
+    @classmethod
+    def get_face(cls, card_type, text):
+        face = cls.faces.get((card_type, text))
+        if face is None:
+            card_width = 300
+            card_height = 200
+            face = pygame.Surface((card_width, card_height))
+            face.fill(GOLD if card_type == "CHANCE" else BLUE)
+            title = render_text(get_named_font("bold"), card_type, BLACK)
+            description = render_text(get_named_font("regular"), text, BLACK)
+            face.blit(title, (card_width//2 - title.get_width()//2, 20))
+            face.blit(description, (card_width//2 - description.get_width()//2, 100))
+            cls.faces[(card_type, text)] = face
+        return face
+
+    def start(self, now):
+        self.start_time = now
+
+    def update(self, now):
+        if now - self.start_time >= self.duration:
+            self.open = False
+        return self.open
+
+    def handle_event(self, event):
+        # The card takes all input while it is up
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self.open = False
+            return True
+        return event.type == pygame.MOUSEBUTTONUP
+
+    def draw(self, screen, renderer):
+        renderer.track("overlay", screen.blit(self.surface, self.pos), id(self))
+
+class PropertyModal:
+    # Buy/sell dialog for the property a player landed on. The panel and its
+    # button are built when the dialog opens and rebuilt only when the
+    # ownership or the player's money changes.
+    def __init__(self, engine, player, property):
+        self.engine = engine
+        self.player = player
+        self.property = property
+        self.open = True
+        self.state = None
+        self.build()
+
+    def build(self):
+        player, property = self.player, self.property
+        self.state = (property.owner, player.money)
+        info_width = 400
+        info_height = 300
+        self.info_pos = (WINDOW_WIDTH//2 - info_width//2, WINDOW_HEIGHT//2 - info_height//2)
+        
+        # Panel with its shadow, as one surface
+        self.panel = pygame.Surface((info_width + 6, info_height + 6), pygame.SRCALPHA)
+        self.panel.fill(BLACK, (2, 2, info_width + 4, info_height + 4))
+        self.panel.fill(WHITE, (0, 0, info_width, info_height))
+        # Utility rent depends on the dice, so show the multiplier
+        rent = f"{property.get_rent(1)}x dice" if property.kind == "utility" else f"${property.get_rent()}"
+        lines = [
+            (render_text(get_named_font("bold"), property.name, BLACK), 40),
+            (render_text(get_named_font("regular"), f"Price: ${property.price}", BLACK), 100),
+            (render_text(get_named_font("regular"), f"Rent: {rent}", BLACK), 140),
+            (render_text(get_named_font("regular"), f"Your Money: ${player.money}", BLACK), 180),
+        ]
+        for text, y in lines:
+            self.panel.blit(text, (info_width//2 - text.get_width()//2, y))
+        
+        # Button based on property state
+        button_y = self.info_pos[1] + info_height - 80
+        if property.owner is None and player.money >= property.price:
+            self.button = Button("Buy Property", WINDOW_WIDTH//2 - 150, button_y, 300, 50, GREEN, (0, 200, 0))
+        elif property.owner == player:
+            self.button = Button("Sell Property", WINDOW_WIDTH//2 - 150, button_y, 300, 50, RED, (200, 0, 0))
+        else:
+            self.button = None
+
+    def start(self, now):
+        pass
+
+    def update(self, now):
+        if (self.property.owner, self.player.money) != self.state:
+            self.build()
+        return self.open
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.open = False
+            return True
+        if not self.button:
+            return False
+        if event.type == pygame.MOUSEMOTION:
+            self.button.handle_event(event)
+        elif event.type == pygame.MOUSEBUTTONDOWN and self.button.check_click(event.pos):
+            if self.property.owner is None:
+                self.engine.buy_property(self.player, self.property)
+            elif self.property.owner == self.player:
+                self.engine.sell_property(self.player, self.property)
+            return True
+        return False
+
+    def draw(self, screen, renderer):
+        screen.blit(get_overlay(screen.get_size(), (0, 0, 0, 128)), (0, 0))
+        screen.blit(self.panel, self.info_pos)
+        color = None
+        if self.button:
+            self.button.draw(screen)
+            color = self.button.current_color
+        # The modal dims the whole window, so any change to it is a full present
+        renderer.track("overlay", screen.get_rect(), (id(self), self.state, color))
+
 class Game:
     def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Monopoly")
+        self.screen = init_display()
+        self.renderer = DirtyRectRenderer(self.screen)
+        self.drawn_state = None
         self.clock = pygame.time.Clock()
+        self.telemetry = FrameTelemetry()
+        self.profiler = Profiler()  # F3 or MONOPOLY_PROFILE=1
+        self.autosaver = Autosaver()  # Written after every turn, resumed with F9
+        self.turn_log = None  # Every event of the game in play, for replay.py
         self.running = True
         self.game_state = "menu"  # menu, player_select, playing, auction, minigame
         self.board = Board()
-        self.players = []
-        self.current_player = 0
+        self.engine = GameEngine(players=[], board=self.board, buy_policy=None)
         self.dice_roll = None
         self.rolling = False
         self.roll_time = 0
         self.target_roll_time = 1.0
         self.current_minigame = None
-        self.buy_button = None
-        self.sell_button = None
-        self.showing_property_options = False
-        
-        # Initialize card decks
-        self.chance_deck = CardDeck(create_chance_cards())
-        self.community_chest_deck = CardDeck(create_community_chest_cards())
+        self.overlays = []  # Card reveals and dialogs, front one is shown
         
         # Load fonts
-        try:
-            self.title_font = pygame.font.Font("assets/fonts/PlayfairDisplaySemibold.ttf", 72)
-            self.menu_font = pygame.font.Font("assets/fonts/PlayfairDisplay-VariableFont_wght.ttf", 36)
-        except FileNotFoundError as e:
-            print(f"Error loading fonts: {e}")
-            print("Using system fonts as fallback")
-            self.title_font = pygame.font.SysFont("arial", 72, bold=True)
-            self.menu_font = pygame.font.SysFont("arial", 36)
+        self.title_font = get_named_font("title")
+        self.menu_font = get_named_font("menu")
         
         # Create menu buttons
         self.create_menu_buttons()
@@ -430,6 +369,14 @@ class Game:
         # Create roll dice button
         self.roll_button = Button("Roll Dice", WINDOW_WIDTH - 150, WINDOW_HEIGHT - 100, 120, 40, BLUE, LIGHT_BLUE)
 
+    @property
+    def players(self):
+        return self.engine.players
+
+    @property
+    def current_player(self):
+        return self.engine.current_player
+
     def create_menu_buttons(self):
         button_width = 200
         button_height = 50
@@ -462,14 +409,15 @@ class Game:
             self.running = False
     
     def handle_game_events(self, event):
+        # The front overlay sees input first
+        if self.overlays and self.overlays[0].handle_event(event):
+            return
+        
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and not self.rolling:
                 self.roll_dice()
             elif event.key == pygame.K_ESCAPE:
-                if self.showing_property_options:
-                    self.showing_property_options = False
-                else:
-                    self.game_state = "menu"
+                self.game_state = "menu"
         
         # Handle button clicks
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -478,28 +426,13 @@ class Game:
                 if not self.rolling:
                     self.roll_dice()
                 return
-            
-            # Check property buttons if showing options
-            if self.showing_property_options:
-                current_player = self.players[self.current_player]
-                property = self.board.get_property_at_position(current_player.position)
-                
-                if property and isinstance(property, Property):
-                    if self.buy_button and property.owner is None:
-                        if self.buy_button.check_click(event.pos):
-                            if current_player.money >= property.price:
-                                current_player.money -= property.price
-                                property.owner = current_player
-                    
-                    elif self.sell_button and property.owner == current_player:
-                        if self.sell_button.check_click(event.pos):
-                            current_player.money += property.price // 2
-                            property.owner = None
         
         if self.current_minigame:
             self.current_minigame.handle_event(event)
     
     def roll_dice(self):
+        # Rolling dismisses an open property dialog
+        self.overlays.clear()
         # Start dice roll animation
         self.rolling = True
         self.roll_time = 0
@@ -513,10 +446,15 @@ class Game:
         if self.dice.update():  # If dice animation is complete
             self.rolling = False
             current_player = self.players[self.current_player]
-            total_roll = sum(self.dice.values)
             
-            # Move player
-            current_player.move(total_roll)
+            # Resolve the whole turn in the rules engine, then animate it
+            result = self.engine.play_turn(dice=tuple(self.dice.values))
+            self.autosaver.save(self.engine)
+            self.roll_time = pygame.time.get_ticks()
+            if result.jailed:
+                current_player.go_to_jail()
+            else:
+                current_player.start_move_animation(result.start, result.end)
             
             # Add particle effects
             for i, value in enumerate(self.dice.values):
@@ -528,27 +466,26 @@ class Game:
                     count=value * 3
                 )
             
-            # Check for special squares
-            landed_property = self.board.get_property_at_position(current_player.position)
-            if landed_property:
-                if isinstance(landed_property, Property):
-                    if landed_property.owner is None:  # Property is unowned
-                        self.show_property_options(landed_property)
-                    elif landed_property.owner != current_player:  # Pay rent
-                        rent = landed_property.get_rent()
-                        current_player.money -= rent
-                        landed_property.owner.money += rent
-                elif landed_property.type == "chance":
-                    self.draw_chance_card()
-                elif landed_property.type == "community_chest":
-                    self.draw_community_chest_card()
+            if result.card:
+                card_type = "CHANCE" if result.card_kind == "chance" else "COMMUNITY CHEST"
+                self.show_overlay(CardReveal(card_type, result.card))
             
-            # Check for doubles
-            if self.dice.values[0] == self.dice.values[1]:
-                pass  # Player gets another turn
-            else:
-                self.next_player()
-    
+            if result.pending_purchase:
+                self.show_overlay(PropertyModal(self.engine, current_player, result.pending_purchase))
+
+    def show_overlay(self, overlay):
+        # Overlays queue up and are shown one at a time
+        if not self.overlays:
+            overlay.start(pygame.time.get_ticks())
+        self.overlays.append(overlay)
+
+    def update_overlays(self):
+        now = pygame.time.get_ticks()
+        while self.overlays and not self.overlays[0].update(now):
+            self.overlays.pop(0)
+            if self.overlays:
+                self.overlays[0].start(now)
+
     def start_minigame(self, game_type):
         if game_type == "dice_roll":
             self.current_minigame = DiceRollGame(self.screen, self.players[self.current_player])
@@ -562,37 +499,46 @@ class Game:
             self.current_minigame = JailEscape(self.screen, self.players[self.current_player])
             self.current_minigame.start()
     
-    def update(self):
-        # Update dice
-        self.dice.update()
+    def update(self, dt=TICK):
+        # One fixed simulation step of dt seconds
         self.handle_transition()
         self.particle_system.update()
         
         if self.game_state == "playing":
-            # Update current player
-            self.players[self.current_player].update(
-                (WINDOW_WIDTH - BOARD_SIZE)//2,
-                (WINDOW_HEIGHT - BOARD_SIZE)//2,
-                BOARD_SIZE
-            )
+            # Update players
+            self.any_player_moving = False
+            for player in self.players:
+                player.update(
+                    (WINDOW_WIDTH - BOARD_SIZE)//2,
+                    (WINDOW_HEIGHT - BOARD_SIZE)//2,
+                    BOARD_SIZE
+                )
+                if player.moving:
+                    self.any_player_moving = True
             
             # Update dice roll
             self.update_dice_roll()
+            self.update_overlays()
             
             # Update minigame if active
             if self.current_minigame:
-                self.current_minigame.update()
+                self.current_minigame.update(dt)
                 if not self.current_minigame.running:
+                    minigame = self.current_minigame
                     self.current_minigame = None
-                    self.next_player()
-        elif self.game_state == "menu":
-            # Update menu
-            self.draw_menu()
-        elif self.game_state == "player_select":
-            # Update player selection
-            self.draw_player_select()
+                    if minigame.outcome:
+                        player, value = minigame.outcome
+                        self.engine.apply_minigame(player, minigame.kind, value)
+                    self.engine.end_turn()
+                    self.autosaver.save(self.engine)
 
-    def draw(self):
+    def draw(self, alpha=1.0):
+        # alpha: fraction of a simulation step elapsed since the last update, for interpolation
+        # Screen changes need a full present; otherwise only reported rects go out
+        if self.game_state != self.drawn_state:
+            self.renderer.invalidate()
+            self.drawn_state = self.game_state
+        
         self.screen.fill(WHITE)
         
         if self.game_state == "menu":
@@ -600,64 +546,56 @@ class Game:
         elif self.game_state == "player_select":
             self.draw_player_select()
         elif self.game_state == "playing":
-            self.draw_game()
-            # Draw dice and particles
-            self.dice.draw(self.screen)
-            self.particle_system.draw(self.screen)
+            self.draw_game(alpha)
+            # Draw particles
+            with self.profiler.section("particles"):
+                self.renderer.add_many(self.particle_system.draw(self.screen))
+        
+        if self.profiler.enabled:
+            self.renderer.track("profiler", self.profiler.draw(self.screen), self.profiler.surface_frame)
         
-        pygame.display.flip()
+        with self.profiler.section("present"):
+            self.renderer.present()
     
     def draw_menu(self):
         # Draw background gradient with maroon tint
-        for y in range(WINDOW_HEIGHT):
-            color = (
-                int(128 + 127 * (1 - y/WINDOW_HEIGHT)),  # Maroon base
-                int(0 + 255 * (1 - y/WINDOW_HEIGHT)),
-                int(0 + 255 * (1 - y/WINDOW_HEIGHT))
-            )
-            pygame.draw.line(self.screen, color, (0, y), (WINDOW_WIDTH, y))
+        self.screen.blit(get_vertical_gradient(self.screen.get_size(), (255, 255, 255), MAROON), (0, 0))
         
         # Draw title with shadow and glow
-        title = self.title_font.render("MONOPOLY", True, BLACK)
+        title = render_text(self.title_font, "MONOPOLY", BLACK)
         self.screen.blit(title, (WINDOW_WIDTH//2 - title.get_width()//2 + 2, 102))
-        title = self.title_font.render("MONOPOLY", True, GOLD)
+        title = render_text(self.title_font, "MONOPOLY", GOLD)
         self.screen.blit(title, (WINDOW_WIDTH//2 - title.get_width()//2, 100))
         
         # Draw decorative elements with maroon tint
         for i in range(5):
             x = random.randint(0, WINDOW_WIDTH)
             y = random.randint(0, WINDOW_HEIGHT)
-            pygame.draw.circle(self.screen, (128, 0, 0, 30), (x, y), 2)
+            self.renderer.add(pygame.draw.circle(self.screen, (128, 0, 0, 30), (x, y), 2))
         
         # Draw buttons
-        self.play_button.draw(self.screen)
-        self.exit_button.draw(self.screen)
+        self.renderer.track("play_button", self.play_button.draw(self.screen), self.play_button.current_color)
+        self.renderer.track("exit_button", self.exit_button.draw(self.screen), self.exit_button.current_color)
     
     def draw_player_select(self):
         # Draw background gradient
-        for y in range(WINDOW_HEIGHT):
-            color = (
-                int(200 * (1 - y/WINDOW_HEIGHT)),
-                int(200 * (1 - y/WINDOW_HEIGHT)),
-                int(255 * (1 - y/WINDOW_HEIGHT))
-            )
-            pygame.draw.line(self.screen, color, (0, y), (WINDOW_WIDTH, y))
+        self.screen.blit(get_vertical_gradient(self.screen.get_size(), (200, 200, 255), BLACK), (0, 0))
         
         # Draw title with shadow
-        title = self.title_font.render("Select Players", True, BLACK)
+        title = render_text(self.title_font, "Select Players", BLACK)
         self.screen.blit(title, (WINDOW_WIDTH//2 - title.get_width()//2 + 2, 102))
-        title = self.title_font.render("Select Players", True, BLUE)
+        title = render_text(self.title_font, "Select Players", BLUE)
         self.screen.blit(title, (WINDOW_WIDTH//2 - title.get_width()//2, 100))
         
         # Draw subtitle
-        subtitle = FONT_REGULAR.render("Choose number of players (1-6):", True, BLACK)
+        subtitle = render_text(get_named_font("regular"), "Choose number of players (1-6):", BLACK)
         self.screen.blit(subtitle, (WINDOW_WIDTH//2 - subtitle.get_width()//2, 200))
         
         # Draw player buttons
-        for button in self.player_buttons:
-            button.draw(self.screen)
+        for i, button in enumerate(self.player_buttons):
+            self.renderer.track(("player_button", i), button.draw(self.screen), button.current_color)
     
-    def draw_game(self):
+    def draw_game(self, alpha=1.0):
         # Draw board
         board_size = 800
         board_x = (self.screen.get_width() - board_size) // 2
@@ -668,32 +606,26 @@ class Game:
         pygame.draw.rect(self.screen, BOARD_SHADOW, shadow_rect)
         
         # Draw board background with gradient
-        for y in range(board_y, board_y + board_size):
-            color = (
-                int(245 + 10 * (1 - (y - board_y)/board_size)),
-                int(245 + 10 * (1 - (y - board_y)/board_size)),
-                int(245 + 10 * (1 - (y - board_y)/board_size))
-            )
-            pygame.draw.line(self.screen, color, (board_x, y), (board_x + board_size, y))
+        self.screen.blit(get_vertical_gradient((board_size, board_size), WHITE, BOARD_BG), (board_x, board_y))
         
         # Draw board border with shadow
         pygame.draw.rect(self.screen, BOARD_BORDER, (board_x, board_y, board_size, board_size), 2)
         
         # Draw properties
-        self.board.draw(self.screen, self.players[self.current_player], self.dice.values)
+        with self.profiler.section("board"):
+            self.renderer.add_many(self.board.draw(self.screen, self.players[self.current_player], self.dice.values))
         
-        # Update and draw players
-        self.any_player_moving = False
-        for player in self.players:
-            player.update(board_x, board_y, board_size)
-            if player.moving:
-                self.any_player_moving = True
-            player.draw(self.screen)
+        # Draw players
+        for i, player in enumerate(self.players):
+            state = (player.animation_state, tokens.quantize(player.scale, player.rotation),
+                     tokens.quantize(1.0, player.celebration_rotation), player.jail_turns > 0)
+            with self.profiler.section(f"player {i+1}"):
+                self.renderer.track(("player", i), player.draw(self.screen, alpha), state)
         
         # Draw info panel with shadow
         current = self.players[self.current_player]
         info_text = f"Current Player: {current.name} (${current.money})"
-        text = FONT_REGULAR.render(info_text, True, BLACK)
+        text = render_text(get_named_font("regular"), info_text, BLACK)
         text_rect = text.get_rect()
         text_rect.x = 10
         text_rect.y = 10
@@ -701,25 +633,32 @@ class Game:
         pygame.draw.rect(self.screen, (0, 0, 0, 40), panel_rect.inflate(2, 2))
         pygame.draw.rect(self.screen, INFO_BG, panel_rect)
         self.screen.blit(text, text_rect)
+        self.renderer.track("info_panel", panel_rect.inflate(2, 2), info_text)
         
         # Draw roll dice button
-        self.roll_button.draw(self.screen)
+        self.renderer.track("roll_button", self.roll_button.draw(self.screen), self.roll_button.current_color)
         
         # Draw dice during animation or briefly after roll
         current_time = pygame.time.get_ticks()
         if self.rolling or (self.dice.animation_complete and current_time - self.roll_time < 2000):
-            self.dice.draw(self.screen)
+            with self.profiler.section("dice"):
+                dice_rect = self.dice.draw(self.screen)
+            if self.dice.rolling:
+                # Full-window dimming overlay; tracked so the frame it disappears is repainted too
+                self.renderer.invalidate()
+                self.renderer.track("dice_overlay", self.screen.get_rect())
+            self.renderer.track("dice", dice_rect, tuple(self.dice.values))
         
         # Draw minigame if active
         if self.current_minigame:
-            self.current_minigame.draw()
-        
-        # Draw property options if showing
-        if self.showing_property_options:
-            current_player = self.players[self.current_player]
-            property = self.board.get_property_at_position(current_player.position)
-            if property and isinstance(property, Property):
-                self.show_property_options(property)
+            with self.profiler.section("minigame"):
+                self.current_minigame.draw()
+            self.renderer.invalidate()
+            self.renderer.track("minigame", self.screen.get_rect())
+        
+        # Draw the front card or dialog
+        if self.overlays:
+            self.overlays[0].draw(self.screen, self.renderer)
 
     def handle_transition(self):
         if self.transitioning:
@@ -730,98 +669,115 @@ class Game:
         else:
             self.transition_alpha = 0
 
-    def next_player(self):
-        self.current_player = (self.current_player + 1) % len(self.players)
-        self.dice_roll = None
-    
     def run(self):
+        # Fixed-timestep loop: the simulation advances in TICK steps of real
+        # time however long rendering takes, and frames interpolate between steps
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
+            frame_start = time.perf_counter()
+            self.profiler.begin_frame()
+            frame_time = min(frame_start - previous, MAX_FRAME_TIME)
+            previous = frame_start
+            accumulator += frame_time
+            
+            with self.profiler.section("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        self.profiler.toggle()
+                        self.renderer.invalidate()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                        self.resume_game()
+                        continue
                 
-                if self.game_state == "menu":
-                    self.handle_menu_events(event)
-                elif self.game_state == "player_select":
-                    for i, button in enumerate(self.player_buttons):
-                        if button.handle_event(event):
-                            self.setup_players(i+1)
-                            self.game_state = "playing"  # Explicitly set game state
-                            break  # Break after setting up players
-                elif self.game_state == "playing":
-                    self.handle_game_events(event)
+                    if self.game_state == "menu":
+                        self.handle_menu_events(event)
+                    elif self.game_state == "player_select":
+                        for i, button in enumerate(self.player_buttons):
+                            if button.handle_event(event):
+                                self.setup_players(i+1)
+                                self.start_log()
+                                self.game_state = "playing"  # Explicitly set game state
+                                break  # Break after setting up players
+                    elif self.game_state == "playing":
+                        self.handle_game_events(event)
+            
+            steps = 0
+            update_start = time.perf_counter()
+            with self.profiler.section("update"):
+                while accumulator >= TICK:
+                    self.update(TICK)
+                    accumulator -= TICK
+                    steps += 1
             
-            self.update()
-            self.draw()
+            render_start = time.perf_counter()
+            self.draw(accumulator / TICK)
+            render_end = time.perf_counter()
+            self.telemetry.record(frame_time * 1000, (render_start - update_start) * 1000,
+                                  (render_end - render_start) * 1000, steps)
+            self.profiler.end_frame()
             self.clock.tick(FPS)
         
+        self.autosaver.close()
+        if self.turn_log:
+            self.turn_log.close()
+        if self.telemetry.frames:
+            print(self.telemetry.report())
+        if self.profiler.frames:
+            print(f"Profile written to {self.profiler.dump(telemetry=self.telemetry.summary())}")
         pygame.quit()
         sys.exit()
 
     def setup_players(self, num_players):
         colors = [RED, BLUE, GREEN, YELLOW, ORANGE, PURPLE]
-        self.players = []
+        players = []
         for i in range(num_players):
-            self.players.append(Player(f"Player {i+1}", colors[i], 500))
-        self.current_player = 0
+            players.append(Player(f"Player {i+1}", colors[i], 500))
+        self.reset_ui()
+        # Initialize board and the rules engine that owns the game state
+        self.board = Board()
+        self.engine = GameEngine(players=players, board=self.board, buy_policy=None)
+
+    def reset_ui(self):
+        # Presentation state of a game, shared by a new game and a resumed one
         self.rolling = False  # Reset rolling state
         self.dice_roll = [1, 1]  # Initialize with default dice values
         self.current_minigame = None  # Reset minigame state
-        # Initialize board
-        self.board = Board()
+        self.overlays = []
         # Initialize dice
         self.dice = Dice()
         # Initialize particle system
         self.particle_system = ParticleSystem()
 
-    def show_property_options(self, property):
-        self.showing_property_options = True
-        
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Create property info surface with shadow
-        info_width = 400
-        info_height = 300
-        info_surface = pygame.Surface((info_width, info_height))
-        info_surface.fill(WHITE)
-        
-        # Add property information
-        title = FONT_BOLD.render(property.name, True, BLACK)
-        price = FONT_REGULAR.render(f"Price: ${property.price}", True, BLACK)
-        rent = FONT_REGULAR.render(f"Rent: ${property.get_rent()}", True, BLACK)
-        current_player = self.players[self.current_player]
-        player_money = FONT_REGULAR.render(f"Your Money: ${current_player.money}", True, BLACK)
-        
-        # Center text on info surface
-        info_surface.blit(title, (info_width//2 - title.get_width()//2, 40))
-        info_surface.blit(price, (info_width//2 - price.get_width()//2, 100))
-        info_surface.blit(rent, (info_width//2 - rent.get_width()//2, 140))
-        info_surface.blit(player_money, (info_width//2 - player_money.get_width()//2, 180))
-        
-        # Add shadow to info surface
-        info_shadow = pygame.Surface((info_width + 4, info_height + 4))
-        info_shadow.fill((0, 0, 0, 40))
-        
-        # Position info box in center of screen
-        info_pos = (WINDOW_WIDTH//2 - info_width//2, WINDOW_HEIGHT//2 - info_height//2)
-        self.screen.blit(info_shadow, (info_pos[0] + 2, info_pos[1] + 2))
-        self.screen.blit(info_surface, info_pos)
-        
-        # Add buttons with proper spacing
-        button_y = info_pos[1] + info_height - 80
-        
-        # Create buttons based on property state
-        if property.owner is None and current_player.money >= property.price:
-            self.buy_button = Button("Buy Property", WINDOW_WIDTH//2 - 150, button_y, 300, 50, GREEN, (0, 200, 0))
-            self.buy_button.draw(self.screen)
-        elif property.owner == current_player:
-            self.sell_button = Button("Sell Property", WINDOW_WIDTH//2 - 150, button_y, 300, 50, RED, (200, 0, 0))
-            self.sell_button.draw(self.screen)
-        
-        pygame.display.flip()
+    def start_log(self):
+        # A new log per game (or resume), flushed as it goes so it survives a
+        # crash; the previous one is kept under a numbered name
+        if self.turn_log:
+            self.turn_log.close()
+        previous = rotate_log(LOG_PATH)
+        if previous:
+            print(f"Previous turn log kept as {previous}")
+        self.turn_log = TurnLog(LOG_PATH, flush=True).start(self.engine)
+
+    def resume_game(self):
+        # Continue from the autosave, from the menu or mid-game; the current
+        # game is only replaced once the save has loaded
+        board = Board()
+        engine = GameEngine(players=[], board=board, buy_policy=None)
+        try:
+            load_game(engine, self.autosaver.path)
+        except (OSError, SaveError) as e:
+            print(f"Could not resume: {e}")
+            return
+        self.reset_ui()
+        self.board = board
+        self.engine = engine
+        self.start_log()
+        self.game_state = "playing"
+        if self.engine.pending_purchase:
+            self.show_overlay(PropertyModal(self.engine, *self.engine.pending_purchase))
 
 if __name__ == "__main__":
     game = Game()
@@ -1,64 +1,55 @@
 import pygame
 import random
 import math
+from fonts import get_font, render_text
+from particles import ParticleSystem
+import assets
+import dice_atlas
 
 class MiniGame:
+    kind = None  # Name passed to GameEngine.apply_minigame
+    
     def __init__(self, screen, player):
         self.screen = screen
         self.player = player
         self.running = False
         self.result = None
+        self.outcome = None  # (player, value) for the engine to apply once the game closes
         self.animation_frame = 0
         self.animation_speed = 0.1
-        self.particles = []
+        self.particles = ParticleSystem(lifetime=50)  # Fades over 50 frames
         
     def create_particle(self, x, y, color):
-        self.particles.append({
-            'x': x,
-            'y': y,
-            'color': color,
-            'size': random.randint(2, 5),
-            'speed_x': random.uniform(-2, 2),
-            'speed_y': random.uniform(-2, 2),
-            'life': 1.0
-        })
+        self.particles.add_particles(x, y, color, count=1)
     
     def update_particles(self):
-        for particle in self.particles[:]:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['life'] -= 0.02
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
     
     def draw_particles(self):
-        for particle in self.particles:
-            alpha = int(255 * particle['life'])
-            color = (*particle['color'], alpha)
-            pygame.draw.circle(self.screen, color, 
-                             (int(particle['x']), int(particle['y'])), 
-                             particle['size'])
+        self.particles.draw(self.screen, return_rects=False)
     
     def draw_result(self, text, color):
-        font = pygame.font.Font(None, 48)
-        text_surface = font.render(text, True, color)
+        font = get_font(None, 48)
+        text_surface = render_text(font, text, color)
         text_rect = text_surface.get_rect(center=(self.screen.get_width()//2, 
                                                  self.screen.get_height()//2))
         self.screen.blit(text_surface, text_rect)
         
         # Draw continue prompt
-        prompt_font = pygame.font.Font(None, 24)
-        prompt = prompt_font.render("Press SPACE to continue", True, (255, 255, 255))
+        prompt_font = get_font(None, 24)
+        prompt = render_text(prompt_font, "Press SPACE to continue", (255, 255, 255))
         prompt_rect = prompt.get_rect(center=(self.screen.get_width()//2, 
                                             self.screen.get_height()//2 + 50))
         self.screen.blit(prompt, prompt_rect)
 
 class DiceRollGame(MiniGame):
+    kind = "dice_roll"
+    
     def __init__(self, screen, player):
         super().__init__(screen, player)
         self.dice_values = [1, 1]
         self.rolling = False
-        self.roll_speed = 0.1
+        self.roll_speed = 6.0  # Roll progress per second
         self.roll_time = 0
         self.target_roll_time = 2.0
         self.dice_images = []
@@ -66,9 +57,9 @@ class DiceRollGame(MiniGame):
     
     def load_dice_images(self):
         for i in range(1, 7):
-            img = pygame.image.load(f"assets/images/dice{i}.png")
-            img = pygame.transform.scale(img, (60, 60))
-            self.dice_images.append(img)
+            # A missing or unreadable dice image is drawn instead
+            self.dice_images.append(assets.load_image(assets.image_path(f"dice{i}.png"), (60, 60))
+                                    or dice_atlas.get_face(60, i, 0))
     
     def start(self):
         self.running = True
@@ -76,7 +67,7 @@ class DiceRollGame(MiniGame):
         self.roll_time = 0
         self.result = None
     
-    def update(self):
+    def update(self, dt):
         if not self.running:
             return
             
@@ -84,7 +75,7 @@ class DiceRollGame(MiniGame):
         self.update_particles()
         
         if self.rolling:
-            self.roll_time += self.roll_speed
+            self.roll_time += self.roll_speed * dt
             if self.roll_time >= self.target_roll_time:
                 self.rolling = False
                 self.dice_values = [random.randint(1, 6), random.randint(1, 6)]
@@ -131,9 +122,11 @@ class DiceRollGame(MiniGame):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
             if self.result:
                 self.running = False
-                self.player.receive_money(self.result * 10)  # Reward based on roll
+                self.outcome = (self.player, self.result * 10)  # Reward based on roll
 
 class PropertyAuction(MiniGame):
+    kind = "property_auction"
+    
     def __init__(self, screen, player, property):
         super().__init__(screen, player)
         self.property = property
@@ -143,7 +136,7 @@ class PropertyAuction(MiniGame):
         self.time_left = 10
         self.bidding = True
         self.winner = None
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(None, 36)
     
     def start(self):
         self.running = True
@@ -151,7 +144,7 @@ class PropertyAuction(MiniGame):
         self.time_left = 10
         self.winner = None
     
-    def update(self):
+    def update(self, dt):
         if not self.running:
             return
             
@@ -159,7 +152,7 @@ class PropertyAuction(MiniGame):
         self.update_particles()
         
         if self.bidding:
-            self.time_left -= 0.016  # Approximately 60 FPS
+            self.time_left -= dt  # Real seconds elapsed
             if self.time_left <= 0:
                 self.bidding = False
                 self.winner = self.player  # Default to current player if no other bids
@@ -172,9 +165,9 @@ class PropertyAuction(MiniGame):
         self.screen.fill((0, 0, 0))
         
         # Draw property info
-        property_text = self.font.render(self.property.name, True, (255, 255, 255))
-        price_text = self.font.render(f"Current Bid: ${self.current_bid}", True, (255, 215, 0))
-        time_text = self.font.render(f"Time Left: {int(self.time_left)}s", True, (255, 255, 255))
+        property_text = render_text(self.font, self.property.name, (255, 255, 255))
+        price_text = render_text(self.font, f"Current Bid: ${self.current_bid}", (255, 215, 0))
+        time_text = render_text(self.font, f"Time Left: {int(self.time_left)}s", (255, 255, 255))
         
         self.screen.blit(property_text, 
                         (self.screen.get_width()//2 - property_text.get_width()//2, 100))
@@ -185,8 +178,8 @@ class PropertyAuction(MiniGame):
         
         # Draw bidding controls
         if self.bidding:
-            up_text = self.font.render("Press UP to bid higher", True, (255, 255, 255))
-            down_text = self.font.render("Press DOWN to bid lower", True, (255, 255, 255))
+            up_text = render_text(self.font, "Press UP to bid higher", (255, 255, 255))
+            down_text = render_text(self.font, "Press DOWN to bid lower", (255, 255, 255))
             self.screen.blit(up_text, 
                            (self.screen.get_width()//2 - up_text.get_width()//2, 300))
             self.screen.blit(down_text, 
@@ -204,7 +197,7 @@ class PropertyAuction(MiniGame):
             if event.key == pygame.K_SPACE and not self.bidding:
                 self.running = False
                 if self.winner:
-                    self.winner.buy_property(self.property)
+                    self.outcome = (self.winner, self.property)
             elif event.key == pygame.K_UP and self.bidding:
                 self.current_bid += self.bid_increment
                 self.create_particle(
@@ -222,6 +215,8 @@ class PropertyAuction(MiniGame):
                     )
 
 class JailEscape(MiniGame):
+    kind = "jail_escape"
+    
     def __init__(self, screen, player):
         super().__init__(screen, player)
         self.bars = []
@@ -229,7 +224,7 @@ class JailEscape(MiniGame):
         self.key_position = (random.randint(100, 700), random.randint(100, 500))
         self.key_collected = False
         self.time_left = 30
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(None, 36)
     
     def setup_bars(self):
         # Create vertical bars
@@ -248,7 +243,7 @@ class JailEscape(MiniGame):
         self.time_left = 30
         self.key_position = (random.randint(100, 700), random.randint(100, 500))
     
-    def update(self):
+    def update(self, dt):
         if not self.running:
             return
             
@@ -256,7 +251,7 @@ class JailEscape(MiniGame):
         self.update_particles()
         
         if not self.key_collected:
-            self.time_left -= 0.016  # Approximately 60 FPS
+            self.time_left -= dt  # Real seconds elapsed
             if self.time_left <= 0:
                 self.running = False
     
@@ -277,7 +272,7 @@ class JailEscape(MiniGame):
                              (int(self.key_position[0]), int(self.key_position[1])), 15)
         
         # Draw time
-        time_text = self.font.render(f"Time Left: {int(self.time_left)}s", True, (255, 255, 255))
+        time_text = render_text(self.font, f"Time Left: {int(self.time_left)}s", (255, 255, 255))
         self.screen.blit(time_text, (10, 10))
         
         # Draw particles
@@ -291,7 +286,7 @@ class JailEscape(MiniGame):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and self.key_collected:
                 self.running = False
-                self.player.use_jail_card()
+                self.outcome = (self.player, None)
             elif event.type == pygame.MOUSEBUTTONDOWN and not self.key_collected:
                 # Check if clicked on key
                 mouse_pos = pygame.mouse.get_pos()
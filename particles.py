@@ -0,0 +1,112 @@
+import numpy as np
+import pygame
+
+# Particle alpha is quantized so every (size, colour, alpha) sprite is drawn once
+ALPHA_BUCKETS = 16
+MIN_SIZE = 2
+MAX_SIZE = 5
+
+# Pre-rendered sprites shared by every particle system
+_sprites = {}
+
+
+def get_particle_sprite(size, color, bucket):
+    key = (size, color, bucket)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        alpha = int(255 * bucket / (ALPHA_BUCKETS - 1))
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+        _sprites[key] = sprite
+    return sprite
+
+
+class ParticleSystem:
+    # Struct-of-arrays particle pool: live particles are packed at the front of
+    # fixed-capacity arrays, updated in one vectorized step and drawn with blits()
+    def __init__(self, capacity=10000, lifetime=30, seed=None):
+        self.capacity = capacity
+        self.lifetime = lifetime  # Frames a particle lives by default
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)  # 1.0 at spawn, dead at 0
+        self.decay = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)  # Index into palette
+        self.arrays = (self.x, self.y, self.vx, self.vy, self.life, self.decay, self.size, self.color)
+        self.palette = []
+        self.palette_index = {}
+        self.sprite_lookup = {}
+
+    def __len__(self):
+        return self.count
+
+    def color_index(self, color):
+        color = tuple(color[:3])
+        index = self.palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.palette_index[color] = index
+        return index
+
+    def add_particles(self, x, y, color, count=10, lifetime=None, speed=2.0):
+        # The pool is capacity-bounded: spawns beyond it are dropped
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        s = slice(self.count, self.count + count)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = self.rng.uniform(-speed, speed, count)
+        self.vy[s] = self.rng.uniform(-speed, speed, count)
+        self.life[s] = 1.0
+        self.decay[s] = 1.0 / (lifetime or self.lifetime)
+        self.size[s] = self.rng.integers(MIN_SIZE, MAX_SIZE + 1, count)
+        self.color[s] = self.color_index(color)
+        self.count += count
+
+    def update(self, steps=1):
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vx[:n] * steps
+        self.y[:n] += self.vy[:n] * steps
+        self.life[:n] -= self.decay[:n] * steps
+
+        # Compact survivors to the front of the pool
+        alive = self.life[:n] > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for array in self.arrays:
+                array[:keep.size] = array[:n][keep]
+            self.count = keep.size
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, screen, return_rects=True):
+        n = self.count
+        if not n:
+            return []
+        size = self.size[:n]
+        bucket = np.minimum((self.life[:n] * ALPHA_BUCKETS).astype(np.int32), ALPHA_BUCKETS - 1)
+        keys = ((self.color[:n] * (MAX_SIZE + 1) + size) * ALPHA_BUCKETS + bucket).tolist()
+        xs = (self.x[:n] - size).astype(np.int32).tolist()
+        ys = (self.y[:n] - size).astype(np.int32).tolist()
+
+        lookup = self.sprite_lookup
+        for key in set(keys) - lookup.keys():
+            color, rest = divmod(key, (MAX_SIZE + 1) * ALPHA_BUCKETS)
+            lookup[key] = get_particle_sprite(rest // ALPHA_BUCKETS, self.palette[color], rest % ALPHA_BUCKETS)
+
+        # Rects of everything drawn, for dirty-rect presentation
+        sequence = zip(map(lookup.__getitem__, keys), zip(xs, ys))
+        if return_rects:
+            return screen.blits(sequence)
+        screen.blits(sequence, doreturn=0)
+        return []
@@ -1,5 +1,9 @@
-import pygame
 import math
+from lazy import lazy_import
+
+# Rendering modules load on first draw; the rules engine never needs them
+fonts = lazy_import("fonts")
+tokens = lazy_import("tokens")
 
 class Player:
     def __init__(self, name, color, money):
@@ -8,6 +12,7 @@ class Player:
         self.money = money
         self.position = 0
         self.properties = []
+        self.group_masks = {}  # Colour group -> bits of the properties owned in it, kept by Property.owner
         self.jail_cards = 0
         self.jail_turns = 0
         self.moving = False
@@ -16,6 +21,11 @@ class Player:
         self.current_move = 0
         self.total_spaces = 40  # Total number of spaces on the board
         self.path_positions = []  # List to store positions along the path
+        self.passing_go = False
+        self.bankrupt = False
+        self.x = 0
+        self.y = 0
+        self.previous_pos = None  # Screen position one simulation step ago, for interpolation
         
         # Visual properties
         self.rotation = 0
@@ -31,46 +41,45 @@ class Player:
         self.target_celebration_rotation = 0
         
     def move(self, spaces):
-        if self.jail_turns > 0:
-            self.jail_turns -= 1
-            return
-            
-        # Calculate new position
-        self.target_position = (self.position + spaces) % self.total_spaces
-        self.moving = True
+        # Rules state changes immediately, the token animates along the path
+        start = self.position
+        self.position = (start + spaces) % self.total_spaces
+        
+        # Check if passing GO
+        if spaces > 0 and self.position < start:
+            self.money += 200  # Collect $200 for passing GO
+        
+        self.start_move_animation(start, self.position, spaces)
+    
+    def start_move_animation(self, start, end, spaces=None):
+        if spaces is None:
+            spaces = (end - start) % self.total_spaces
+        self.target_position = end
+        self.moving = spaces != 0
+        self.passing_go = spaces > 0 and end < start
         self.current_move = 0
         
         # Generate path positions
         self.path_positions = []
-        current_pos = self.position
-        for _ in range(spaces):
-            current_pos = (current_pos + 1) % self.total_spaces
+        current_pos = start
+        step = 1 if spaces > 0 else -1
+        for _ in range(abs(spaces)):
+            current_pos = (current_pos + step) % self.total_spaces
             self.path_positions.append(current_pos)
-        
-        # Check if passing GO
-        if self.target_position < self.position:
-            self.money += 200  # Collect $200 for passing GO
             
     def move_to(self, position):
-        self.target_position = position
-        self.moving = True
+        start = self.position
+        self.position = position
+        if position < start:
+            self.money += 200  # Advancing past GO
+        self.start_move_animation(start, position)
         self.animation_state = "moving"
     
-    def move_to_nearest_utility(self):
-        current_pos = self.position
-        utility_positions = [12, 28]  # Electric Company and Water Works
-        nearest = min(utility_positions, key=lambda x: (x - current_pos) % 40)
-        self.move_to(nearest)
-    
-    def move_to_nearest_railroad(self):
-        current_pos = self.position
-        railroad_positions = [5, 15, 25, 35]
-        nearest = min(railroad_positions, key=lambda x: (x - current_pos) % 40)
-        self.move_to(nearest)
-    
     def go_to_jail(self):
         self.position = 10  # Jail position
-        self.jail_turns = 0
+        self.jail_turns = 3
+        self.moving = False
+        self.path_positions = []
         self.animation_state = "jumping"
         self.target_bounce_height = 30
     
@@ -85,22 +94,11 @@ class Player:
             return True
         return False
     
-    def pay_repairs(self):
-        total_cost = 0
-        for property in self.properties:
-            if property.houses > 0:
-                total_cost += property.houses * 25
-            if property.hotel:
-                total_cost += 100
-        self.pay_money(total_cost)
-    
-    def pay_each_player(self, amount):
-        # This will be handled by the game class
-        return amount
-    
     def update(self, board_x, board_y, board_size):
         if not self.moving:
+            self.previous_pos = None
             return
+        self.previous_pos = (self.x, self.y)
             
         # Update movement
         self.current_move += self.move_speed
@@ -109,6 +107,12 @@ class Player:
             self.moving = False
             self.current_move = 0
             self.path_positions = []
+            # Settle the move's effects; update() stops running until the
+            # next move, and the idle token is drawn as one sprite
+            self.scale = self.target_scale = 1.0
+            self.rotation = 0
+            self.celebration_rotation = 0
+            self.animation_state = "idle"
             return
             
         # Calculate current position based on path
@@ -135,7 +139,7 @@ class Player:
         # Update visual effects
         if self.moving:
             self.scale = 1.2  # Slightly larger while moving
-            if self.target_position < self.position:  # Passing GO
+            if self.passing_go:  # Passing GO
                 self.rotation += 5  # Rotate while passing GO
         else:
             self.scale = 1.0
@@ -189,7 +193,7 @@ class Player:
         # Update scale
         self.target_scale += (1.0 - self.target_scale) * 0.1
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         board_size = 600
         board_x = (screen.get_width() - board_size) // 2
         board_y = (screen.get_height() - board_size) // 2
@@ -197,63 +201,39 @@ class Player:
         if not self.moving:
             self.x, self.y = self.get_position_coordinates(board_x, board_y, board_size, self.position)
         
-        # Apply bounce height
-        current_y = self.y - self.bounce_height
-        
-        # Create token surface
-        token_size = 30
-        token_surface = pygame.Surface((token_size * 2, token_size * 2), pygame.SRCALPHA)
-        
-        # Draw shadow
-        shadow_surface = pygame.Surface((token_size * 2, token_size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(shadow_surface, (0, 0, 0, 100), 
-                         (token_size + self.shadow_offset, token_size + self.shadow_offset), 
-                         token_size)
-        screen.blit(shadow_surface, 
-                   (self.x - token_size + self.shadow_offset, 
-                    current_y - token_size + self.shadow_offset))
+        # Blend between the last two simulation steps
+        draw_x, draw_y = self.x, self.y
+        if self.moving and self.previous_pos:
+            draw_x = self.previous_pos[0] + (self.x - self.previous_pos[0]) * alpha
+            draw_y = self.previous_pos[1] + (self.y - self.previous_pos[1]) * alpha
         
-        # Draw token
-        pygame.draw.circle(token_surface, self.color, (token_size, token_size), token_size)
-        pygame.draw.circle(token_surface, (0, 0, 0), (token_size, token_size), token_size, 2)
-        
-        # Draw token design
-        pygame.draw.circle(token_surface, (255, 255, 255), (token_size, token_size), token_size - 4)
-        pygame.draw.circle(token_surface, self.color, (token_size, token_size), token_size - 6)
-        
-        # Scale and rotate token
-        scaled_size = int(token_size * 2 * self.scale)
-        scaled_token = pygame.transform.scale(token_surface, (scaled_size, scaled_size))
+        # Apply bounce height
+        x, y = int(draw_x), int(draw_y - self.bounce_height)
         
-        # Apply rotation based on animation state
-        if self.animation_state == "celebrating":
-            rotated_token = pygame.transform.rotate(scaled_token, self.celebration_rotation)
+        rotation = self.celebration_rotation if self.animation_state == "celebrating" else self.rotation
+        if tokens.quantize(self.scale, rotation) == (1.0, 0):
+            # Idle token: shadow, token and name label are one pre-composited sprite
+            sprite, (offset_x, offset_y) = tokens.get_idle_token(self.color, self.name)
+            drawn = screen.blit(sprite, (x + offset_x, y + offset_y))
         else:
-            rotated_token = pygame.transform.rotate(scaled_token, self.rotation)
-        
-        # Draw token
-        screen.blit(rotated_token, 
-                   (self.x - rotated_token.get_width()//2, 
-                    current_y - rotated_token.get_height()//2))
-        
-        # Draw player name with background
-        font = pygame.font.Font(None, 20)
-        text = font.render(self.name, True, (0, 0, 0))
-        text_rect = text.get_rect()
-        text_rect.x = int(self.x + 40)
-        text_rect.y = int(current_y + 25)
-        
-        # Draw name background
-        pygame.draw.rect(screen, (255, 255, 255, 200), text_rect.inflate(10, 5))
-        screen.blit(text, text_rect)
+            drawn = screen.blit(tokens.get_shadow(), (x - tokens.TOKEN_SIZE + tokens.SHADOW_OFFSET,
+                                                      y - tokens.TOKEN_SIZE + tokens.SHADOW_OFFSET))
+            frame = tokens.get_token_frame(self.color, self.scale, rotation)
+            drawn = drawn.union(screen.blit(frame, (x - frame.get_width() // 2, y - frame.get_height() // 2)))
+            label, (offset_x, offset_y) = tokens.get_label(self.name)
+            drawn = drawn.union(screen.blit(label, (x + tokens.LABEL_OFFSET[0] + offset_x,
+                                                    y + tokens.LABEL_OFFSET[1] + offset_y)))
         
         # Draw jail status
         if self.jail_turns > 0:
-            jail_text = font.render("JAIL", True, (255, 0, 0))
+            jail_text = fonts.render_text(fonts.get_font(None, 20), "JAIL", (255, 0, 0))
             jail_rect = jail_text.get_rect()
-            jail_rect.x = int(self.x + 40)
-            jail_rect.y = int(current_y + 45)
-            screen.blit(jail_text, jail_rect)
+            jail_rect.x = x + 40
+            jail_rect.y = y + 45
+            drawn = drawn.union(screen.blit(jail_text, jail_rect))
+        
+        # Screen area covered, for dirty-rect presentation
+        return drawn
     
     def get_position_coordinates(self, board_x, board_y, board_size, pos):
         space_size = board_size / 11  # 11 spaces per side
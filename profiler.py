@@ -0,0 +1,147 @@
+import os
+import json
+import time
+import contextlib
+import numpy as np
+import pygame
+from fonts import get_font, render_text
+
+_null_section = contextlib.nullcontext()
+
+GRAPH_HEIGHT = 60
+GRAPH_MAX_MS = 33.3  # Top of the frame-time graph
+TARGET_MS = 1000 / 60
+REFRESH_FRAMES = 15  # Table is re-rendered this often
+TABLE_COLUMNS = (150, 200, 250)  # Right edges of the p50/p95/p99 columns
+TABLE_WIDTH = 250
+
+
+class Section:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+
+
+class Profiler:
+    # Per-subsystem frame timings in fixed-size ring buffers. Disabled, every
+    # section() is the same no-op context manager.
+    def __init__(self, capacity=300, enabled=None, dump_path=None):
+        if enabled is None:
+            enabled = os.environ.get("MONOPOLY_PROFILE", "0") not in ("", "0")
+        self.enabled = enabled
+        self.capacity = capacity
+        self.dump_path = dump_path or os.environ.get("MONOPOLY_PROFILE_FILE", "profile.json")
+        self.buffers = {}  # section -> ring buffer of ms per frame
+        self.current = {}
+        self.index = 0
+        self.filled = 0
+        self.frames = 0
+        self.frame_start = None
+        self.surface = None
+        self.surface_frame = -REFRESH_FRAMES
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frame_start = None
+
+    def section(self, name):
+        if not self.enabled:
+            return _null_section
+        return Section(self, name)
+
+    def add(self, name, seconds):
+        self.current[name] = self.current.get(name, 0.0) + seconds * 1000
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        self.add("frame", time.perf_counter() - self.frame_start)
+        for name in self.current.keys() - self.buffers.keys():
+            self.buffers[name] = np.zeros(self.capacity)
+        # Sections that did not run this frame record zero
+        for name, buffer in self.buffers.items():
+            buffer[self.index] = self.current.get(name, 0.0)
+        self.current = {}
+        self.index = (self.index + 1) % self.capacity
+        self.filled = min(self.filled + 1, self.capacity)
+        self.frames += 1
+
+    def samples(self, name):
+        # Oldest to newest
+        buffer = self.buffers[name]
+        if self.filled < self.capacity:
+            return buffer[:self.filled]
+        return np.roll(buffer, -self.index)
+
+    def percentiles(self):
+        if not self.filled:
+            return {}
+        return {name: dict(zip(("p50", "p95", "p99", "max"),
+                               np.percentile(self.samples(name), [50, 95, 99, 100]).round(3).tolist()))
+                for name in sorted(self.buffers)}
+
+    def render(self):
+        font = get_font(None, 18)
+        white = (255, 255, 255)
+        rows = [("section", "p50", "p95", "p99")]
+        rows += [(name, f"{s['p50']:.2f}", f"{s['p95']:.2f}", f"{s['p99']:.2f}")
+                 for name, s in self.percentiles().items()]
+        line_height = font.get_linesize()
+        width = max(self.capacity, TABLE_WIDTH) + 10
+        height = GRAPH_HEIGHT + 15 + line_height * len(rows)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+
+        # Frame-time graph, one column per frame, with the 60 fps budget line
+        if "frame" in self.buffers:
+            base = GRAPH_HEIGHT + 5
+            for x, ms in enumerate(self.samples("frame")):
+                bar = int(min(ms, GRAPH_MAX_MS) / GRAPH_MAX_MS * GRAPH_HEIGHT)
+                color = (0, 200, 0) if ms <= TARGET_MS else (220, 60, 60)
+                pygame.draw.line(surface, color, (5 + x, base), (5 + x, base - bar))
+            budget = base - int(TARGET_MS / GRAPH_MAX_MS * GRAPH_HEIGHT)
+            pygame.draw.line(surface, (255, 255, 0), (5, budget), (5 + self.capacity, budget))
+
+        # Table: name left-aligned, timings right-aligned in fixed columns
+        y = GRAPH_HEIGHT + 10
+        for name, *values in rows:
+            surface.blit(render_text(font, name, white), (5, y))
+            for right, value in zip(TABLE_COLUMNS, values):
+                text = render_text(font, value, white)
+                surface.blit(text, (right - text.get_width(), y))
+            y += line_height
+        return surface
+
+    def draw(self, screen):
+        if not self.enabled:
+            return None
+        if self.frames - self.surface_frame >= REFRESH_FRAMES:
+            self.surface = self.render()
+            self.surface_frame = self.frames
+        return screen.blit(self.surface, (screen.get_width() - self.surface.get_width() - 10, 10))
+
+    def dump(self, path=None, **extra):
+        # Extra keyword arguments are written alongside the samples
+        path = path or self.dump_path
+        if not self.filled:
+            return None
+        data = {
+            "frames": self.frames,
+            "window": self.filled,
+            "sections": self.percentiles(),
+            "samples": {name: self.samples(name).round(3).tolist() for name in sorted(self.buffers)},
+            **extra,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        return path
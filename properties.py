@@ -1,26 +1,57 @@
 class Property:
-    def __init__(self, name, price, color, position):
+    def __init__(self, name, price, color, position, rents=(), kind="street"):
         self.name = name
         self.price = price
         self.color = color
         self.position = position
-        self.owner = None
+        self.kind = kind  # street, railroad or utility
+        # Streets: base, monopoly, 1-4 houses, hotel (passed as printed on the
+        # deed, without the doubled monopoly rent). Railroads: rent by number
+        # owned. Utilities: dice multiplier by number owned.
+        if kind == "street":
+            rents = (rents[0], rents[0] * 2, *rents[1:])
+        self.rents = tuple(rents)
+        # Colour group index, this property's bit in it, the bits of the
+        # whole group and the number of bits set in each possible group mask;
+        # set by Board.compile_spaces
+        self.group = None
+        self.group_bit = 0
+        self.group_full = 0
+        self.group_counts = (0,)
+        self._owner = None
         self.houses = 0
         self.hotel = False
         self.mortgaged = False
+
+    @property
+    def owner(self):
+        return self._owner
+
+    @owner.setter
+    def owner(self, owner):
+        # Every ownership change goes through here and keeps the owners'
+        # per-group bitmasks in step
+        if self._owner is not None:
+            self._owner.group_masks[self.group] &= ~self.group_bit
+        if owner is not None:
+            owner.group_masks[self.group] = owner.group_masks.get(self.group, 0) | self.group_bit
+        self._owner = owner
+
+    def has_monopoly(self):
+        return self._owner is not None and self._owner.group_masks[self.group] == self.group_full
         
-    def get_rent(self):
-        if not self.owner or self.mortgaged:
+    def get_rent(self, dice_total=0):
+        owner = self._owner
+        if owner is None or self.mortgaged:
             return 0
-            
-        base_rent = self.price // 10  # Base rent is 10% of property price
-        
-        if self.hotel:
-            return base_rent * 5
-        elif self.houses > 0:
-            return base_rent * (self.houses + 1)
-        else:
-            return base_rent
+        if self.kind == "street":
+            if self.hotel:
+                return self.rents[6]
+            if self.houses:
+                return self.rents[1 + self.houses]
+            return self.rents[1] if owner.group_masks[self.group] == self.group_full else self.rents[0]
+        rent = self.rents[self.group_counts[owner.group_masks[self.group]] - 1]
+        return rent * dice_total if self.kind == "utility" else rent
     
     def can_build_house(self):
         if not self.owner or self.mortgaged or self.hotel:
@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from turnlog import Replayer, LogError, ReplayError, load_log, LOG_PATH
+from replay_index import ReplayIndex
+
+# Turns skipped per key in the GUI
+SEEK_KEYS = {"right": 1, "left": -1, "page down": 10, "page up": -10}
+
+
+def replay_file(path, verify=True):
+    replayer = Replayer(load_log(path), verify=verify)
+    replayer.run()
+    return replayer
+
+
+def count_turns(path, verify=True):
+    replayer = replay_file(path, verify)
+    return replayer.engine.turn - replayer.start_turn
+
+
+def replay_files(paths, verify=True, workers=1, progress=None):
+    # Headless, full speed, one log per task; returns (logs, turns)
+    games = turns = 0
+    if workers == 1:
+        for count in (count_turns(path, verify) for path in paths):
+            games += 1
+            turns += count
+            if progress:
+                progress(games, turns)
+        return games, turns
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for count in pool.map(count_turns, paths, [verify] * len(paths), chunksize=16):
+            games += 1
+            turns += count
+            if progress:
+                progress(games, turns)
+    return games, turns
+
+
+def print_state(engine):
+    winner = engine.winner()
+    print(f"Turn {engine.turn}, winner: {winner.name if winner else 'none'}")
+    for player in engine.players:
+        status = " (bankrupt)" if player.bankrupt else ""
+        print(f"  {player.name}: ${player.money}, position {player.position}, "
+              f"{len(player.properties)} properties{status}")
+
+
+def run_gui(data, turn=0, verify=True):
+    # The game window driven by the log: Right/Left step a turn, Page Down/Up
+    # ten turns, Home/End jump to the start/end. The log is indexed up front
+    # so any seek costs a keyframe load plus a few deltas.
+    import pygame
+    import main
+    from engine import GameEngine
+    game = main.Game()
+    game.reset_ui()
+    replayer = Replayer(data, engine=GameEngine(players=[], board=game.board, buy_policy=None), verify=verify)
+    game.engine = replayer.engine
+    game.game_state = "playing"
+    last = ReplayIndex.build(replayer).last_turn
+    replayer.seek(turn)
+
+    while game.running:
+        target = None
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                game.running = False
+            elif event.type == pygame.KEYDOWN:
+                name = pygame.key.name(event.key)
+                if name in SEEK_KEYS:
+                    target = replayer.engine.turn + SEEK_KEYS[name]
+                elif name == "home":
+                    target = replayer.start_turn
+                elif name == "end":
+                    target = last
+                elif name == "escape":
+                    game.running = False
+        if target is not None:
+            previous = replayer.engine.turn
+            before = [player.position for player in game.players]
+            replayer.seek(max(target, replayer.start_turn))
+            # A single step forward animates the moves; other seeks jump there
+            if target == previous + 1:
+                for player, start in zip(game.players, before):
+                    if player.position != start:
+                        player.start_move_animation(start, player.position)
+            game.renderer.invalidate()
+        pygame.display.set_caption(f"Monopoly replay: turn {replayer.engine.turn}/{last}")
+        game.update()
+        game.draw()
+        game.clock.tick(main.FPS)
+    pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay turn logs headlessly at full speed, or in the game window")
+    parser.add_argument("logs", nargs="*", default=[LOG_PATH])
+    parser.add_argument("--turn", type=int, default=None, help="stop at this turn and print the state")
+    parser.add_argument("--no-verify", dest="verify", action="store_false",
+                        help="skip checking the replay against the logged facts")
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the CPU count")
+    parser.add_argument("--gui", action="store_true", help="step through the first log in the game window")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.gui:
+            run_gui(load_log(args.logs[0]), args.turn or 0, args.verify)
+            return 0
+        if args.turn is not None or len(args.logs) == 1:
+            replayer = Replayer(load_log(args.logs[0]), verify=args.verify)
+            start_time = time.perf_counter()
+            replayer.seek(args.turn if args.turn is not None else replayer.last_turn())
+            elapsed = time.perf_counter() - start_time
+            print_state(replayer.engine)
+            print(f"Replayed {replayer.engine.turn - replayer.start_turn} turns in {elapsed * 1000:.1f}ms")
+            return 0
+
+        def report(games, turns):
+            print(f"\r{games}/{len(args.logs)} logs", end="", file=sys.stderr, flush=True)
+
+        start_time = time.perf_counter()
+        games, turns = replay_files(args.logs, args.verify, args.workers or os.cpu_count() or 1, progress=report)
+        elapsed = time.perf_counter() - start_time
+        print(file=sys.stderr)
+        print(f"Replayed {games} logs, {turns} turns in {elapsed:.2f}s ({turns / elapsed:.0f} turns/sec)")
+    except (OSError, LogError, ReplayError) as e:
+        print(f"Replay failed: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+from array import array
+from bisect import bisect_right
+
+from savegame import save_state, load_state
+
+KEYFRAME_INTERVAL = 100  # Turns between full snapshots; a seek applies at most this many deltas
+
+# Game state as one flat int vector, so a turn's delta is just the slots that
+# changed: engine counters, then per player, per property and per deck blocks
+ENGINE_SLOTS = 5  # turn, current player, doubles, pending player + 1, pending property + 1
+PLAYER_SLOTS = 5  # money, position, jail turns, jail cards, bankrupt
+HOTEL = 1
+MORTGAGED = 2
+
+
+class Layout:
+    def __init__(self, engine):
+        self.players = ENGINE_SLOTS
+        self.owners = self.players + PLAYER_SLOTS * len(engine.players)  # owner index + 1, 0 for the bank
+        count = len(engine.board.properties)
+        self.houses = self.owners + count
+        self.flags = self.houses + count
+        self.decks = self.flags + count  # per deck: shuffles, cursor, order, holders
+        decks = (engine.chance_deck, engine.community_chest_deck)
+        self.size = self.decks + sum(2 + 2 * len(deck.cards) for deck in decks)
+
+
+def state_vector(engine):
+    players = engine.players
+    player_index = {id(p): i for i, p in enumerate(players)}
+    properties = engine.board.properties
+    pending_player = pending_property = 0
+    if engine.pending_purchase:
+        player, property = engine.pending_purchase
+        pending_player = player_index[id(player)] + 1
+        pending_property = properties.index(property) + 1
+
+    vector = [engine.turn, engine.current_player, engine.doubles_rolled, pending_player, pending_property]
+    for p in players:
+        vector += (p.money, p.position, p.jail_turns, p.jail_cards, p.bankrupt)
+    vector += [player_index[id(p.owner)] + 1 if p.owner else 0 for p in properties]
+    vector += [p.houses for p in properties]
+    vector += [p.hotel * HOTEL | p.mortgaged * MORTGAGED for p in properties]
+    for deck in (engine.chance_deck, engine.community_chest_deck):
+        vector += (deck.shuffles, deck.cursor, *deck.order, *deck.holders)
+    return vector
+
+
+def apply_vector(engine, vector, layout):
+    # Everything but the players' property lists, which restore() keeps in
+    # acquisition order as ownership changes
+    players = engine.players
+    properties = engine.board.properties
+    engine.turn, engine.current_player, engine.doubles_rolled, pending_player, pending_property = vector[:ENGINE_SLOTS]
+    engine.pending_purchase = None
+    if pending_player:
+        engine.pending_purchase = (players[pending_player - 1], properties[pending_property - 1])
+
+    for i, player in enumerate(players):
+        start = layout.players + i * PLAYER_SLOTS
+        player.money, player.position, player.jail_turns, player.jail_cards, bankrupt = vector[start:start + PLAYER_SLOTS]
+        player.bankrupt = bool(bankrupt)
+
+    for i, property in enumerate(properties):
+        owner = vector[layout.owners + i]
+        property.owner = players[owner - 1] if owner else None
+        property.houses = vector[layout.houses + i]
+        flags = vector[layout.flags + i]
+        property.hotel = bool(flags & HOTEL)
+        property.mortgaged = bool(flags & MORTGAGED)
+
+    # A deck's seed never changes, so it comes from the keyframe
+    start = layout.decks
+    for deck in (engine.chance_deck, engine.community_chest_deck):
+        count = len(deck.cards)
+        deck.shuffles, deck.cursor = vector[start:start + 2]
+        deck.order = array("B", vector[start + 2:start + 2 + count])
+        deck.holders = array("B", vector[start + 2 + count:start + 2 + 2 * count])
+        start += 2 + 2 * count
+
+
+class ReplayIndex:
+    # Keyframe-plus-delta index over a replayed log. Turn boundaries (the
+    # state just before each roll) are numbered from the log's first turn;
+    # every interval-th one keeps a full save snapshot and every one keeps
+    # the slots that changed since the previous boundary. Any turn is rebuilt
+    # from the nearest earlier keyframe (binary search) plus at most interval
+    # deltas. Deltas leave the RNG as it was at the keyframe: replays take
+    # their dice from the log.
+    def __init__(self, interval=KEYFRAME_INTERVAL):
+        self.interval = interval
+        self.first_turn = 0
+        self.keyframe_turns = array("I")
+        self.keyframes = []
+        self.positions = array("I")  # Log record to resume from, per boundary
+        self.offsets = array("I", [0, 0])  # Delta i is slots/values[offsets[i]:offsets[i + 1]]
+        self.slots = array("H")
+        self.values = array("i")
+        self.layout = None
+
+    @classmethod
+    def build(cls, replayer, interval=KEYFRAME_INTERVAL):
+        # One pass over the log; leaves the replayer at the end of it
+        index = cls(interval)
+        replayer.reset()
+        engine = replayer.engine
+        replayer.seek(replayer.start_turn)
+        index.first_turn = engine.turn
+        index.layout = Layout(engine)
+        previous = state_vector(engine)
+        index.add_keyframe(engine)
+        index.positions.append(replayer.position)
+        while not replayer.done():
+            replayer.seek(engine.turn + 1)
+            vector = state_vector(engine)
+            for slot, (before, after) in enumerate(zip(previous, vector)):
+                if before != after:
+                    index.slots.append(slot)
+                    index.values.append(after)
+            index.offsets.append(len(index.slots))
+            index.positions.append(replayer.position)
+            if (engine.turn - index.first_turn) % interval == 0:
+                index.add_keyframe(engine)
+            previous = vector
+        replayer.index = index
+        return index
+
+    def add_keyframe(self, engine):
+        self.keyframe_turns.append(engine.turn)
+        self.keyframes.append(save_state(engine))
+
+    @property
+    def last_turn(self):
+        return self.first_turn + len(self.positions) - 1
+
+    def restore(self, replayer, turn):
+        # Puts the replayer's engine at the given turn boundary and its log
+        # position right after it
+        engine = replayer.engine
+        turn = min(max(turn, self.first_turn), self.last_turn)
+        keyframe = bisect_right(self.keyframe_turns, turn) - 1
+        load_state(engine, self.keyframes[keyframe])
+        vector = state_vector(engine)
+        layout = self.layout
+        properties = engine.board.properties
+        players = engine.players
+        owners = range(layout.owners, layout.owners + len(properties))
+
+        for i in range(self.keyframe_turns[keyframe] - self.first_turn + 1, turn - self.first_turn + 1):
+            start, end = self.offsets[i], self.offsets[i + 1]
+            for slot, value in zip(self.slots[start:end], self.values[start:end]):
+                if slot in owners:
+                    property = properties[slot - layout.owners]
+                    if vector[slot]:
+                        players[vector[slot] - 1].properties.remove(property)
+                    if value:
+                        players[value - 1].properties.append(property)
+                vector[slot] = value
+
+        apply_vector(engine, vector, layout)
+        replayer.position = self.positions[turn - self.first_turn]
+        replayer.encoder.index(engine)
+        return turn
+
+    def nbytes(self):
+        arrays = (self.keyframe_turns, self.positions, self.offsets, self.slots, self.values)
+        return sum(len(a) * a.itemsize for a in arrays) + sum(len(k) for k in self.keyframes)
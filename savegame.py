@@ -0,0 +1,178 @@
+import os
+import zlib
+import struct
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from player import Player
+
+# Versioned little-endian snapshot of a GameEngine:
+#   header, engine counters, RNG state, players (with their properties in
+#   acquisition order), per-property buildings, deck snapshots, CRC32 trailer
+MAGIC = b"MNPS"
+VERSION = 2
+AUTOSAVE_PATH = "autosave.sav"
+
+HEADER = struct.Struct("<4sH")
+ENGINE = struct.Struct("<IBBBbb")  # turn, current player, doubles, players, pending player, pending property
+RNG = struct.Struct("<IBd")  # generator version, has gauss_next, gauss_next
+PLAYER = struct.Struct("<iBBBB3BB")  # money, position, jail turns, jail cards, bankrupt, colour, name length
+CRC = struct.Struct("<I")
+
+HOTEL = 1
+MORTGAGED = 2
+
+
+class SaveError(Exception):
+    pass
+
+
+def save_state(engine):
+    properties = engine.board.properties
+    property_index = {id(p): i for i, p in enumerate(properties)}
+    player_index = {id(p): i for i, p in enumerate(engine.players)}
+
+    pending_player = pending_property = -1
+    if engine.pending_purchase:
+        player, property = engine.pending_purchase
+        pending_player = player_index[id(player)]
+        pending_property = property_index[id(property)]
+
+    parts = [HEADER.pack(MAGIC, VERSION),
+             ENGINE.pack(engine.turn, engine.current_player, engine.doubles_rolled,
+                         len(engine.players), pending_player, pending_property)]
+
+    version, internal, gauss = engine.rng.getstate()
+    parts.append(RNG.pack(version, gauss is not None, gauss or 0.0))
+    parts.append(array("I", internal).tobytes())
+
+    for player in engine.players:
+        name = player.name.encode()
+        parts.append(PLAYER.pack(player.money, player.position, player.jail_turns, player.jail_cards,
+                                 player.bankrupt, *player.color, len(name)))
+        parts.append(name)
+        parts.append(bytes([len(player.properties)]))
+        parts.append(bytes(property_index[id(p)] for p in player.properties))
+
+    parts.append(bytes(p.houses for p in properties))
+    parts.append(bytes(p.hotel * HOTEL | p.mortgaged * MORTGAGED for p in properties))
+
+    parts.append(engine.chance_deck.snapshot())
+    parts.append(engine.community_chest_deck.snapshot())
+
+    data = b"".join(parts)
+    return data + CRC.pack(zlib.crc32(data))
+
+
+def load_state(engine, data):
+    # Restores a snapshot into an engine built on the same board and card lists
+    if len(data) < HEADER.size + CRC.size or zlib.crc32(data[:-CRC.size]) != CRC.unpack_from(data, len(data) - CRC.size)[0]:
+        raise SaveError("save data is truncated or corrupt")
+    magic, version = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SaveError("not a save file")
+    if version != VERSION:
+        raise SaveError(f"unsupported save version {version}")
+    offset = HEADER.size
+
+    turn, current_player, doubles_rolled, num_players, pending_player, pending_property = ENGINE.unpack_from(data, offset)
+    offset += ENGINE.size
+
+    rng_version, has_gauss, gauss = RNG.unpack_from(data, offset)
+    offset += RNG.size
+    internal = array("I")
+    internal.frombytes(data[offset:offset + 625 * internal.itemsize])
+    offset += 625 * internal.itemsize
+    engine.rng.setstate((rng_version, tuple(internal), gauss if has_gauss else None))
+
+    properties = engine.board.properties
+    for property in properties:
+        property.owner = None
+
+    players = []
+    for _ in range(num_players):
+        money, position, jail_turns, jail_cards, bankrupt, r, g, b, name_length = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+        player = Player(data[offset:offset + name_length].decode(), (r, g, b), money)
+        offset += name_length
+        player.position = position
+        player.jail_turns = jail_turns
+        player.jail_cards = jail_cards
+        player.bankrupt = bool(bankrupt)
+        count = data[offset]
+        player.properties = [properties[i] for i in data[offset + 1:offset + 1 + count]]
+        offset += 1 + count
+        for property in player.properties:
+            property.owner = player
+        players.append(player)
+
+    count = len(properties)
+    for property, houses, flags in zip(properties, data[offset:offset + count], data[offset + count:offset + 2 * count]):
+        property.houses = houses
+        property.hotel = bool(flags & HOTEL)
+        property.mortgaged = bool(flags & MORTGAGED)
+    offset += 2 * count
+
+    for deck in (engine.chance_deck, engine.community_chest_deck):
+        deck.restore(data[offset:offset + deck.snapshot_size()])
+        offset += deck.snapshot_size()
+
+    engine.players = players
+    engine.num_players = num_players
+    engine.turn = turn
+    engine.current_player = current_player
+    engine.doubles_rolled = doubles_rolled
+    engine.pending_purchase = None
+    if pending_player >= 0:
+        engine.pending_purchase = (players[pending_player], properties[pending_property])
+    return engine
+
+
+def write_file(path, data):
+    # Write-then-rename, so a crash mid-write never leaves a broken save
+    temp = path + ".tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def save_game(engine, path=AUTOSAVE_PATH):
+    write_file(path, save_state(engine))
+
+
+def load_game(engine, path=AUTOSAVE_PATH):
+    with open(path, "rb") as f:
+        return load_state(engine, f.read())
+
+
+class Autosaver:
+    # Snapshots on the caller's thread (well under a millisecond) and writes
+    # on a background thread; if writes fall behind, only the newest is kept
+    def __init__(self, path=AUTOSAVE_PATH):
+        self.path = path
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self.lock = threading.Lock()
+        self.pending = None
+        self.saves = 0
+        self.writes = 0
+
+    def save(self, engine):
+        data = save_state(engine)
+        with self.lock:
+            queued = self.pending is not None
+            self.pending = data
+        self.saves += 1
+        if not queued:
+            self.executor.submit(self.flush)
+
+    def flush(self):
+        with self.lock:
+            data, self.pending = self.pending, None
+        if data is not None:
+            write_file(self.path, data)
+            self.writes += 1
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.flush()
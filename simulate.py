@@ -0,0 +1,174 @@
+import os
+import sys
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from engine import GameEngine, BOARD_SPACES
+from turnlog import TurnLog
+
+DEFAULT_CHUNK_SIZE = 250
+TOP_LANDINGS = 10  # Spaces listed in the summary
+
+# One engine per worker process, created lazily and reset for every game
+_worker_engine = None
+
+
+def derive_seed(base_seed, game_index):
+    # Independent 64-bit seed per game, so any single game can be re-run exactly
+    digest = hashlib.blake2b(f"{base_seed}:{game_index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class SimulationStats:
+    def __init__(self, num_players):
+        self.num_players = num_players
+        self.games = 0
+        self.turns = 0
+        self.unfinished = 0
+        self.wins = [0] * num_players
+        self.landings = [0] * BOARD_SPACES
+
+    def record_game(self, engine):
+        self.games += 1
+        self.turns += engine.turn
+        winner = engine.winner()
+        if winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[engine.players.index(winner)] += 1
+
+    def merge(self, other):
+        self.games += other.games
+        self.turns += other.turns
+        self.unfinished += other.unfinished
+        for i, wins in enumerate(other.wins):
+            self.wins[i] += wins
+        for i, count in enumerate(other.landings):
+            self.landings[i] += count
+        return self
+
+    def summary(self, elapsed=None):
+        lines = [f"Games: {self.games}  Turns: {self.turns}  Unfinished: {self.unfinished}"]
+        if self.games:
+            lines.append(f"Average turns per game: {self.turns / self.games:.1f}")
+            for i, wins in enumerate(self.wins):
+                lines.append(f"  Player {i+1}: {wins} wins ({100 * wins / self.games:.1f}%)")
+        if self.turns:
+            lines += self.landing_lines()
+        if elapsed:
+            lines.append(f"Elapsed: {elapsed:.2f}s  ({self.games / elapsed:.0f} games/sec, "
+                         f"{self.turns / elapsed:.0f} turns/sec)")
+        return "\n".join(lines)
+
+    def landing_lines(self, count=TOP_LANDINGS):
+        # Most landed-on spaces, beside the exact long-run odds from analytics.py
+        from analytics import landing_probabilities, space_names
+        from board import Board
+        board = Board(load_images=False)
+        exact = landing_probabilities(board)["spaces"]
+        names = space_names(board)
+        total = sum(self.landings)
+        lines = ["Most landed on (simulated vs exact):"]
+        for position in sorted(range(BOARD_SPACES), key=lambda i: self.landings[i], reverse=True)[:count]:
+            lines.append(f"  {position:2d} {names[position]:<24} {100 * self.landings[position] / total:6.3f}%"
+                         f"  {100 * exact[position]:6.3f}%")
+        return lines
+
+
+def log_path(log_dir, game_index):
+    return os.path.join(log_dir, f"game_{game_index}.log") if log_dir else None
+
+
+def play_game(engine, seed, max_turns, stats=None, log_path=None):
+    engine.reset(seed)
+    log = TurnLog(log_path).start(engine) if log_path else None
+    while not engine.is_over() and engine.turn < max_turns:
+        result = engine.play_turn()
+        if stats:
+            stats.landings[result.end] += 1
+    if log:
+        log.close()
+        engine.log = None
+    if stats:
+        stats.record_game(engine)
+    return engine
+
+
+def run_chunk(base_seed, start, count, num_players, max_turns, log_dir=None):
+    global _worker_engine
+    if _worker_engine is None or _worker_engine.num_players != num_players:
+        _worker_engine = GameEngine(num_players=num_players)
+    stats = SimulationStats(num_players)
+    for game_index in range(start, start + count):
+        play_game(_worker_engine, derive_seed(base_seed, game_index), max_turns, stats,
+                  log_path(log_dir, game_index))
+    return stats
+
+
+def simulate(num_games, num_players=4, workers=None, seed=0, max_turns=1000,
+             chunk_size=DEFAULT_CHUNK_SIZE, progress=None, log_dir=None):
+    workers = workers or os.cpu_count() or 1
+    chunks = [(start, min(chunk_size, num_games - start))
+              for start in range(0, num_games, chunk_size)]
+    stats = SimulationStats(num_players)
+
+    if workers == 1:
+        for start, count in chunks:
+            stats.merge(run_chunk(seed, start, count, num_players, max_turns, log_dir))
+            if progress:
+                progress(stats)
+        return stats
+
+    # Chunks stream back as they finish and are folded into the running totals
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_chunk, seed, start, count, num_players, max_turns, log_dir)
+                   for start, count in chunks]
+        for future in as_completed(futures):
+            stats.merge(future.result())
+            if progress:
+                progress(stats)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Monopoly games headlessly across processes")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the CPU count")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--replay", type=int, default=None, metavar="GAME",
+                        help="re-run a single game index from this seed and print its outcome")
+    parser.add_argument("--log-dir", default=None,
+                        help="write a turn log per game (game_<index>.log) for replay.py")
+    args = parser.parse_args(argv)
+    if args.log_dir:
+        os.makedirs(args.log_dir, exist_ok=True)
+
+    if args.replay is not None:
+        engine = play_game(GameEngine(num_players=args.players),
+                           derive_seed(args.seed, args.replay), args.max_turns,
+                           log_path=log_path(args.log_dir, args.replay))
+        winner = engine.winner()
+        print(f"Game {args.replay}: {engine.turn} turns, winner: {winner.name if winner else 'none'}")
+        for player in engine.players:
+            print(f"  {player.name}: ${player.money}, {len(player.properties)} properties")
+        return
+
+    def report(stats):
+        print(f"\r{stats.games}/{args.games} games", end="", file=sys.stderr, flush=True)
+
+    start_time = time.perf_counter()
+    stats = simulate(args.games, args.players, args.workers, args.seed,
+                     args.max_turns, args.chunk_size, progress=report, log_dir=args.log_dir)
+    print(file=sys.stderr)
+    print(stats.summary(time.perf_counter() - start_time))
+
+
+if __name__ == "__main__":
+    main()
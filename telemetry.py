@@ -0,0 +1,41 @@
+from collections import deque, namedtuple
+
+# One record per rendered frame; times in milliseconds
+FrameRecord = namedtuple("FrameRecord", "frame_ms update_ms render_ms steps dropped")
+
+
+class FrameTelemetry:
+    # Ring buffer of the most recent frames plus running totals
+    def __init__(self, capacity=600):
+        self.records = deque(maxlen=capacity)
+        self.frames = 0
+        self.steps = 0
+        self.dropped = 0
+
+    def record(self, frame_ms, update_ms, render_ms, steps):
+        # Simulation steps beyond the first never got a frame of their own
+        dropped = max(0, steps - 1)
+        self.records.append(FrameRecord(frame_ms, update_ms, render_ms, steps, dropped))
+        self.frames += 1
+        self.steps += steps
+        self.dropped += dropped
+
+    def summary(self):
+        records = self.records
+        count = len(records) or 1
+        return {
+            "frames": self.frames,
+            "steps": self.steps,
+            "dropped": self.dropped,
+            "avg_frame_ms": sum(r.frame_ms for r in records) / count,
+            "avg_update_ms": sum(r.update_ms for r in records) / count,
+            "avg_render_ms": sum(r.render_ms for r in records) / count,
+            "max_frame_ms": max((r.frame_ms for r in records), default=0.0),
+        }
+
+    def report(self):
+        s = self.summary()
+        return (f"{s['frames']} frames, {s['steps']} steps ({s['dropped']} without their own frame); "
+                f"last {len(self.records)} frames: avg {s['avg_frame_ms']:.1f}ms "
+                f"(update {s['avg_update_ms']:.1f}ms, render {s['avg_render_ms']:.1f}ms), "
+                f"max {s['max_frame_ms']:.1f}ms")
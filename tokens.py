@@ -0,0 +1,109 @@
+import pygame
+from collections import OrderedDict
+from fonts import get_font, render_text
+
+TOKEN_SIZE = 30  # Radius of an unscaled token
+SHADOW_OFFSET = 5
+LABEL_OFFSET = (40, 25)  # Name label position relative to the token centre
+
+# Animated frames are keyed by quantized scale and rotation so they get reused
+SCALE_STEP = 0.05
+ROTATION_STEP = 5
+MAX_FRAMES = 256
+
+_frames = OrderedDict()
+_idle = {}
+_labels = {}
+_shadow = None
+
+
+def quantize(scale, rotation):
+    scale = round(scale / SCALE_STEP) * SCALE_STEP
+    rotation = int(round(rotation / ROTATION_STEP) * ROTATION_STEP) % 360
+    return round(scale, 2), rotation
+
+
+def render_token(color):
+    size = TOKEN_SIZE
+    surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (size, size), size)
+    pygame.draw.circle(surface, (0, 0, 0), (size, size), size, 2)
+    pygame.draw.circle(surface, (255, 255, 255), (size, size), size - 4)
+    pygame.draw.circle(surface, color, (size, size), size - 6)
+    return surface
+
+
+def get_shadow():
+    global _shadow
+    if _shadow is None:
+        size = TOKEN_SIZE
+        _shadow = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(_shadow, (0, 0, 0, 100), (size + SHADOW_OFFSET, size + SHADOW_OFFSET), size)
+    return _shadow
+
+
+def get_label(name):
+    # Name on its white backing box, as one surface
+    label = _labels.get(name)
+    if label is None:
+        text = render_text(get_font(None, 20), name, (0, 0, 0))
+        box = text.get_rect().inflate(10, 5)
+        surface = pygame.Surface(box.size)
+        surface.fill((255, 255, 255))
+        surface.blit(text, (-box.x, -box.y))
+        label = (surface, box.topleft)
+        _labels[name] = label
+    return label
+
+
+def get_token_frame(color, scale, rotation):
+    # Token scaled and rotated, centred on its own surface
+    key = (tuple(color),) + quantize(scale, rotation)
+    frame = _frames.get(key)
+    if frame is not None:
+        _frames.move_to_end(key)
+        return frame
+
+    color, scale, rotation = key
+    frame = render_token(color)
+    if scale != 1.0:
+        scaled_size = int(TOKEN_SIZE * 2 * scale)
+        frame = pygame.transform.scale(frame, (scaled_size, scaled_size))
+    if rotation:
+        frame = pygame.transform.rotate(frame, rotation)
+    _frames[key] = frame
+    if len(_frames) > MAX_FRAMES:
+        _frames.popitem(last=False)
+    return frame
+
+
+def get_idle_token(color, name):
+    # Shadow, token and name label composited once; returns (surface, offset from centre)
+    key = (tuple(color), name)
+    idle = _idle.get(key)
+    if idle is None:
+        size = TOKEN_SIZE
+        label, (label_x, label_y) = get_label(name)
+        layers = [
+            (get_shadow(), (SHADOW_OFFSET - size, SHADOW_OFFSET - size)),
+            (get_token_frame(color, 1.0, 0), (-size, -size)),
+            (label, (LABEL_OFFSET[0] + label_x, LABEL_OFFSET[1] + label_y)),
+        ]
+        bounds = pygame.Rect(layers[0][1], layers[0][0].get_size())
+        for surface, offset in layers[1:]:
+            bounds.union_ip(pygame.Rect(offset, surface.get_size()))
+
+        composite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for surface, (x, y) in layers:
+            composite.blit(surface, (x - bounds.x, y - bounds.y))
+        idle = (composite, bounds.topleft)
+        _idle[key] = idle
+    return idle
+
+
+def clear():
+    global _shadow
+    _frames.clear()
+    _idle.clear()
+    _labels.clear()
+    _shadow = None
@@ -0,0 +1,266 @@
+import io
+import os
+import struct
+
+from savegame import save_state, load_state
+
+# Append-only binary log of one game: a header holding a save snapshot of
+# the state the log starts from, then one fixed-size record per event.
+# Commands (rolls, buy/sell decisions, minigame outcomes, ending a turn) are
+# what a replay re-applies; facts (everything a roll led to) are what it
+# checks the replayed engine against.
+MAGIC = b"MNPL"
+VERSION = 1
+LOG_PATH = "turns.log"
+
+HEADER = struct.Struct("<4sHBI")  # magic, version, flags, snapshot length
+RECORD = struct.Struct("<BBhi")  # kind, player, a, b
+
+# Header flags
+POLICY_PURCHASES = 1  # Purchases were made by the engine's buy policy during turns
+
+# Commands
+ROLL = 1  # a: dice as d1 << 8 | d2, b: number of fact records that follow
+BUY = 2  # a: property
+SELL = 3  # a: property
+MINIGAME = 4  # a: minigame, b: value
+END_TURN = 5
+
+# Facts
+MOVE = 16  # a: start, b: end
+CARD = 17  # a: deck (0 chance, 1 community chest), b: card
+PURCHASE = 18  # a: property, b: price
+RENT = 19  # a: owner, b: amount
+TAX = 20  # b: amount
+JAIL = 21  # a: 1 sent to jail, 0 left jail
+BANKRUPT = 22
+TURN = 23  # a: player to move next, b: money after the turn
+
+EVENT_NAMES = {ROLL: "roll", BUY: "buy", SELL: "sell", MINIGAME: "minigame", END_TURN: "end_turn",
+               MOVE: "move", CARD: "card", PURCHASE: "purchase", RENT: "rent", TAX: "tax",
+               JAIL: "jail", BANKRUPT: "bankrupt", TURN: "turn"}
+MINIGAMES = ("dice_roll", "property_auction", "jail_escape")
+
+
+class LogError(Exception):
+    pass
+
+
+class ReplayError(Exception):
+    pass
+
+
+class TurnLog:
+    # Recording side: the engine calls turn() after every play_turn and the
+    # command methods for decisions made outside it. Without a path the log
+    # is kept in memory.
+    def __init__(self, path=None, flush=False):
+        self.path = path
+        self.flush = flush  # Flush every write, so a crash loses nothing
+        self.file = open(path, "wb") if path else io.BytesIO()
+        self.players = self.properties = self.cards = None
+
+    def index(self, engine):
+        # Players, properties and cards are logged by index
+        self.players = {id(p): i for i, p in enumerate(engine.players)}
+        self.properties = {id(p): i for i, p in enumerate(engine.board.properties)}
+        self.cards = {id(card): i for cards in (engine.chance_cards, engine.community_chest_cards)
+                      for i, card in enumerate(cards)}
+
+    def start(self, engine):
+        # Begins the log at the engine's current state and attaches it
+        self.index(engine)
+        snapshot = save_state(engine)
+        flags = POLICY_PURCHASES if engine.buy_policy is not None else 0
+        self.file.seek(0)
+        self.file.truncate()
+        self.write(HEADER.pack(MAGIC, VERSION, flags, len(snapshot)) + snapshot)
+        engine.log = self
+        return self
+
+    def write(self, data):
+        self.file.write(data)
+        if self.flush:
+            self.file.flush()
+
+    def facts(self, engine, result):
+        player = self.players[id(result.player)]
+        records = [RECORD.pack(MOVE, player, result.start, result.end)]
+        if result.left_jail:
+            records.append(RECORD.pack(JAIL, player, 0, 0))
+        if result.card:
+            records.append(RECORD.pack(CARD, player, result.card_kind != "chance", self.cards[id(result.card)]))
+        if result.purchased:
+            records.append(RECORD.pack(PURCHASE, player, self.properties[id(result.purchased)],
+                                       result.purchased.price))
+        if result.rent:
+            records.append(RECORD.pack(RENT, player, self.players[id(result.rent_to)], result.rent))
+        if result.tax:
+            records.append(RECORD.pack(TAX, player, 0, result.tax))
+        if result.jailed:
+            records.append(RECORD.pack(JAIL, player, 1, 0))
+        if result.bankrupt:
+            records.append(RECORD.pack(BANKRUPT, player, 0, 0))
+        records.append(RECORD.pack(TURN, player, engine.current_player, result.player.money))
+        return records
+
+    def turn(self, engine, result):
+        facts = self.facts(engine, result)
+        d1, d2 = result.dice
+        self.write(RECORD.pack(ROLL, self.players[id(result.player)], d1 << 8 | d2, len(facts)) + b"".join(facts))
+
+    def buy(self, player, property):
+        self.write(RECORD.pack(BUY, self.players[id(player)], self.properties[id(property)], 0))
+
+    def sell(self, player, property):
+        self.write(RECORD.pack(SELL, self.players[id(player)], self.properties[id(property)], 0))
+
+    def minigame(self, player, kind, value):
+        if kind == "property_auction":
+            value = self.properties[id(value)]
+        self.write(RECORD.pack(MINIGAME, self.players[id(player)], MINIGAMES.index(kind), value or 0))
+
+    def end_turn(self):
+        self.write(RECORD.pack(END_TURN, 0, 0, 0))
+
+    def getvalue(self):
+        return self.file.getvalue()
+
+    def close(self):
+        if self.path:
+            self.file.close()
+
+
+def read_log(data):
+    # (flags, snapshot, records); a record cut short by a crash is dropped
+    if len(data) < HEADER.size:
+        raise LogError("log is truncated")
+    magic, version, flags, length = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise LogError("not a turn log")
+    if version != VERSION:
+        raise LogError(f"unsupported log version {version}")
+    start = HEADER.size + length
+    if len(data) < start:
+        raise LogError("log is truncated")
+    end = start + (len(data) - start) // RECORD.size * RECORD.size
+    return flags, bytes(data[HEADER.size:start]), memoryview(data)[start:end]
+
+
+def describe(records):
+    return [(EVENT_NAMES.get(kind, kind), player, a, b) for kind, player, a, b in RECORD.iter_unpack(records)]
+
+
+class Replayer:
+    # Re-applies a log to a headless engine at full speed. With verify on,
+    # the facts of every replayed roll are compared with the logged ones and
+    # the first difference raises ReplayError.
+    def __init__(self, data, engine=None, verify=True):
+        from engine import GameEngine
+        self.flags, self.snapshot, self.records = read_log(data)
+        self.count = len(self.records) // RECORD.size
+        self.verify = verify
+        self.engine = engine or GameEngine(players=[], buy_policy=None)
+        # Policy-made purchases are read back from the log, so the replay
+        # does not need the policy that made them
+        self.engine.buy_policy = self.logged_purchase if self.flags & POLICY_PURCHASES else None
+        self.encoder = TurnLog()
+        self.purchases = ()
+        self.index = None  # replay_index.ReplayIndex, for seeking long logs
+        self.reset()
+
+    def reset(self):
+        load_state(self.engine, self.snapshot)
+        self.engine.log = None
+        self.encoder.index(self.engine)
+        self.position = 0  # Next record
+        self.start_turn = self.engine.turn
+
+    def done(self):
+        return self.position >= self.count
+
+    def logged_purchase(self, player, property):
+        return self.encoder.properties[id(property)] in self.purchases
+
+    def step(self):
+        # Applies the next command: the TurnResult for a roll, True for other
+        # commands, None at the end of the log
+        if self.position >= self.count:
+            return None
+        kind, player, a, b = RECORD.unpack_from(self.records, self.position * RECORD.size)
+        self.position += 1
+        engine = self.engine
+        if kind == ROLL:
+            start = self.position
+            self.position += b
+            facts = self.records[start * RECORD.size:self.position * RECORD.size]
+            if self.flags & POLICY_PURCHASES:
+                self.purchases = {prop for fact, _, prop, _ in RECORD.iter_unpack(facts) if fact == PURCHASE}
+            result = engine.play_turn(dice=(a >> 8, a & 0xFF))
+            if self.verify:
+                replayed = b"".join(self.encoder.facts(engine, result))
+                if replayed != facts:
+                    raise ReplayError(f"turn {engine.turn}: logged {describe(facts)}, replayed {describe(replayed)}")
+            return result
+        if kind == BUY:
+            engine.buy_property(engine.players[player], engine.board.properties[a])
+        elif kind == SELL:
+            engine.sell_property(engine.players[player], engine.board.properties[a])
+        elif kind == MINIGAME:
+            game = MINIGAMES[a]
+            value = engine.board.properties[b] if game == "property_auction" else b
+            engine.apply_minigame(engine.players[player], game, value)
+        elif kind == END_TURN:
+            engine.end_turn()
+        else:
+            raise ReplayError(f"unknown event {kind} at record {self.position - 1}")
+        return True
+
+    def seek(self, turn):
+        # State just before the roll of the given turn (or the end of the log).
+        # With an index, backward and long seeks jump to the turn; without one
+        # a backward seek replays from the start
+        if self.index is not None and not self.engine.turn <= turn <= self.engine.turn + self.index.interval:
+            self.index.restore(self, turn)
+        elif turn < self.engine.turn:
+            self.reset()
+        while self.position < self.count:
+            if self.records[self.position * RECORD.size] == ROLL and self.engine.turn >= turn:
+                break
+            self.step()
+        return self.engine.turn
+
+    def run(self):
+        while self.position < self.count:
+            self.step()
+        return self.engine
+
+    def last_turn(self):
+        # Turn reached at the end of the log, found by hopping from roll to roll
+        turn = self.start_turn
+        position = 0
+        while position < self.count:
+            kind, _, _, b = RECORD.unpack_from(self.records, position * RECORD.size)
+            position += 1
+            if kind == ROLL:
+                turn += 1
+                position += b
+        return turn
+
+
+def rotate_log(path):
+    # Moves an existing log aside to the first free turns.<n>.log, so starting
+    # a new log never overwrites a recorded game; returns the new name
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    stem, ext = os.path.splitext(path)
+    n = 1
+    while os.path.exists(f"{stem}.{n}{ext}"):
+        n += 1
+    os.replace(path, f"{stem}.{n}{ext}")
+    return f"{stem}.{n}{ext}"
+
+
+def load_log(path):
+    with open(path, "rb") as f:
+        return f.read()